@@ -1,39 +1,2364 @@
-                import customtkinter as ctk
+import time
+
+STARTUP_CLOCK_START = time.perf_counter()
+
+import customtkinter as ctk
 from tkinter import messagebox, filedialog
-import pandas as pd
-import requests
-from PIL import Image
 from io import BytesIO
-from fuzzywuzzy import fuzz
 import os
+import re
+import json
+import sqlite3
+import pickle
+import argparse
+import asyncio
+import contextvars
 import shutil
-import cairosvg
+import hashlib
+import tempfile
+import tracemalloc
+from urllib.parse import urlsplit
+from xml.etree import ElementTree
 import threading
-from queue import Queue
+from collections import Counter, OrderedDict, defaultdict, deque, namedtuple
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import islice
+from queue import Empty, Queue
 from dotenv import load_dotenv
 
-# --- UI Sizing Constants ---
-UI_SCALE = 1.25
-FONT_SIZE_NORMAL = 13
-FONT_SIZE_LARGE = 16
-FONT_SIZE_TITLE = 24
-PADDING_SMALL = 5
-PADDING_NORMAL = 10
-PADDING_LARGE = 20
-ENTRY_WIDTH = 250
-COMBOBOX_WIDTH = 140
-BUTTON_IPAD = 10
+# Heavy third-party modules are bound by import_heavy_modules(), which the GUI
+# runs off the Tk thread so the Start Page can appear before they are loaded.
+pd = np = requests = HTTPAdapter = Retry = Image = None
+fuzz = fuzz_utils = cairosvg = rapid_fuzz = rapid_process = None
+_heavy_modules_lock = threading.Lock()
+
+
+def import_heavy_modules():
+    """Import pandas, NumPy, requests, PIL, cairosvg and the fuzzy matchers."""
+    global pd, np, requests, HTTPAdapter, Retry, Image
+    global fuzz, fuzz_utils, cairosvg, rapid_fuzz, rapid_process
+    with _heavy_modules_lock:
+        if pd is not None:
+            return
+        import numpy as np
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        from PIL import Image
+        from fuzzywuzzy import fuzz
+        from fuzzywuzzy import utils as fuzz_utils
+        import cairosvg
+
+        try:
+            from rapidfuzz import fuzz as rapid_fuzz
+            from rapidfuzz import process as rapid_process
+        except ImportError:
+            rapid_process = None
+        import pandas as pd
+
+
+# --- UI Sizing Constants ---
+UI_SCALE = 1.25
+FONT_SIZE_NORMAL = 13
+FONT_SIZE_LARGE = 16
+FONT_SIZE_TITLE = 24
+PADDING_SMALL = 5
+PADDING_NORMAL = 10
+PADDING_LARGE = 20
+ENTRY_WIDTH = 250
+COMBOBOX_WIDTH = 140
+BUTTON_IPAD = 10
+BASE_SIZE_MAP = {
+    "Extra Small": 64,
+    "Small": 96,
+    "Medium": 128,
+    "Large": 192,
+    "Extra Large": 256,
+}
+BASE_PADDING_MAP = {"Small": 5, "Medium": 10, "Large": 15}
+ICON_SIZE_MAP = {k: int(v * UI_SCALE) for k, v in BASE_SIZE_MAP.items()}
+
+# --- Configuration ---
+load_dotenv()
+FLATICON_API_KEY = str(os.getenv("FREEPIK_API_KEY"))
+ARASAAC_API_BASE = os.getenv("ARASAAC_API_BASE", "https://api.arasaac.org/api")
+ARASAAC_API_URL = f"{ARASAAC_API_BASE}/pictograms/en/search/"
+ARASAAC_PICTOGRAM_URL = f"{ARASAAC_API_BASE}/pictograms/{{id}}"
+FREEPIK_API_BASE = os.getenv("FREEPIK_API_BASE", "https://api.freepik.com/v1")
+FLATICON_API_URLS = {
+    "search": f"{FREEPIK_API_BASE}/icons",
+    "download": f"{FREEPIK_API_BASE}/icons/{{id}}/download",
+}
+HTTP_TIMEOUT = 10
+HTTP_POOL_SIZE = 16
+HTTP_MAX_PER_HOST = int(os.getenv("HTTP_MAX_PER_HOST", "4"))
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_CHUNK_SIZE = 64 * 1024
+REMOTE_SEARCH_WORKERS = int(os.getenv("REMOTE_SEARCH_WORKERS", "8"))
+VOCAB_DECK_PATH = os.getenv(
+    "VOCAB_DECK", "Gabe_Esperanto cards_filtered_cleaned_no_starters_no_jn_rerank.csv"
+)
+SELECTED_SYMBOLS_DIR = "selected_symbols"
+ASSET_STORE_DIR = os.path.join(SELECTED_SYMBOLS_DIR, ".assets")
+CACHE_DIR = ".pictogram_cache"
+MULBERRY_INFO_CSV = "symbol-info.csv"
+MULBERRY_SYMBOLS_DIR = os.path.join("mulberry-symbols", "EN-symbols")
+OPENMOJI_METADATA_CSV = os.path.join("openmoji-618x618-color", "metadata.csv")
+OPENMOJI_EMOJI_DIR = os.path.join("openmoji-618x618-color", "emojis")
+THUMBNAIL_CACHE_DIR = os.path.join(CACHE_DIR, "thumbnails")
+THUMBNAIL_MEMORY_BUDGET = 64 * 1024 * 1024
+PREFETCH_AHEAD = int(os.getenv("PREFETCH_AHEAD", "3"))
+PREFETCH_CACHE_BUDGET = int(os.getenv("PREFETCH_CACHE_MB", "128")) * 1024 * 1024
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+HTTP_CACHE_TTL = int(os.getenv("HTTP_CACHE_TTL_DAYS", "30")) * 24 * 60 * 60
+HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_MB", "512")) * 1024 * 1024
+OFFLINE_MODE = os.getenv("PICTOGRAM_OFFLINE", "0") == "1"
+STARTUP_REPORT_PATH = os.getenv("STARTUP_REPORT")
+SYMBOL_COLUMNS = [
+    "symbol_filename",
+    "symbol_name",
+    "symbol_source",
+    "symbol_score",
+    "symbol_reviewed",
+    "sentence_symbol_filename",
+    "symbol_asset",
+]
+WORD_SYMBOL_COLUMNS = [
+    col for col in SYMBOL_COLUMNS if col != "sentence_symbol_filename"
+]
+DECK_CORE_COLUMNS = ["english", *SYMBOL_COLUMNS]
+DECK_BINARY_FORMATS = (".parquet", ".feather")
+DECK_FILETYPES = [
+    ("CSV files", "*.csv"),
+    ("Parquet files", "*.parquet"),
+    ("Feather files", "*.feather"),
+]
+DECK_JOURNAL_SUFFIX = ".journal"
+DECK_COMPACT_INTERVAL = int(os.getenv("DECK_COMPACT_INTERVAL", "200"))
+MAX_GRID_COLUMNS = 4
+SYMBOL_SOURCES = ["Mulberry", "OpenMoji", "ARASAAC", "Flaticon"]
+RENDER_WORKERS = min(4, os.cpu_count() or 1)
+WORD_VECTORS_PATH = os.getenv("WORD_VECTORS")  # GloVe/fastText .txt/.vec file
+SEMANTIC_WEIGHT = float(os.getenv("SEMANTIC_WEIGHT", "0.95"))
+# Weight applied to a catalog field's match score, per source and field.
+MULBERRY_FIELD_WEIGHTS = {"symbol-en": 1.0, "tags": 0.75, "category-en": 0.6}
+OPENMOJI_FIELD_WEIGHTS = {
+    "annotation": 1.0,
+    "tags": 0.9,
+    "openmoji_tags": 0.8,
+    "subgroups": 0.6,
+    "group": 0.5,
+}
+# Vocab deck part-of-speech tags mapped to the Mulberry grammar values they allow.
+VOCAB_POS_GRAMMAR = {
+    "*Nouns": ("Noun",),
+    "*Verbs": ("Verb", "VerbComplex"),
+    "*Participles": ("Verb", "VerbComplex"),
+    "*Interjections": ("Interjection",),
+}
+POS_MISMATCH_WEIGHT = 0.8
+RESULTS_PER_SOURCE = int(os.getenv("RESULTS_PER_SOURCE", "48"))
+RESULT_PAGE_SIZE = int(os.getenv("RESULT_PAGE_SIZE", "12"))
+QUERY_MEMO_ENTRIES = int(os.getenv("QUERY_MEMO_ENTRIES", "4096"))
+AUTOPICK_SOURCES = ["Mulberry", "OpenMoji", "ARASAAC"]
+# Above the best a tag-only (OpenMoji tags score 90) or semantic (95) match can
+# reach, so only name matches are picked automatically.
+AUTOPICK_THRESHOLD = int(os.getenv("AUTOPICK_THRESHOLD", "96"))
+AUTOPICK_WORKERS = int(os.getenv("AUTOPICK_WORKERS", "8"))
+AUTOPICK_RATE_LIMITS = {"ARASAAC": 5.0}  # requests per second
+INTEGRITY_WORKERS = 2 * (os.cpu_count() or 1)
+BENCHMARK_BASELINE = os.getenv("BENCHMARK_BASELINE", "benchmark-baseline.json")
+BENCHMARK_REGRESSION_RATIO = 1.2
+BENCHMARK_NOISE_FLOOR_MS = 1.0
+SENTENCE_CANDIDATES = 3  # per source and token
+SENTENCE_ICON_SIZE = ICON_SIZE_MAP["Medium"]
+SENTENCE_WORKERS = 8
+SENTENCE_TOKEN_CACHE_ENTRIES = 1024
+TELEMETRY_ENABLED = os.getenv("PICTOGRAM_TELEMETRY", "0") == "1"
+TELEMETRY_EXPORT_PATH = os.getenv("PICTOGRAM_TELEMETRY_EXPORT")
+TELEMETRY_HISTORY = int(os.getenv("PICTOGRAM_TELEMETRY_HISTORY", "5000"))
+
+# mkstemp() creates files readable by the owner only; replacements should get
+# the mode a plain open() would have given them.
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+
+def file_mode_for(path):
+    """Return the permission bits for a file replacing path."""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        return 0o666 & ~UMASK
+
+
+def atomic_write_bytes(path, data):
+    """Write data to path via a temporary file so readers never see a partial file."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, file_mode_for(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# ---
+# Telemetry
+# ---
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+SpanRecord = namedtuple(
+    "SpanRecord", ["phase", "start", "duration", "search_id", "query", "thread"]
+)
+
+
+class NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Span:
+    def __init__(self, telemetry, phase, search_id, query):
+        self.telemetry = telemetry
+        self.phase = phase
+        self.search_id = search_id
+        self.query = query
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.telemetry.record(
+            SpanRecord(
+                self.phase,
+                self.start,
+                time.perf_counter() - self.start,
+                self.search_id,
+                self.query,
+                threading.get_ident(),
+            )
+        )
+        return False
+
+
+class Telemetry:
+    """Rolling in-memory record of timed hot-path spans.
+
+    When disabled, span() hands back a shared no-op context manager, so the
+    instrumented code pays one method call per span.
+    """
+
+    def __init__(self, enabled=TELEMETRY_ENABLED, history=TELEMETRY_HISTORY):
+        self.enabled = enabled
+        self.records = deque(maxlen=history)
+        self.lock = threading.Lock()
+
+    def span(self, phase, search_id=None, query=None):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, phase, search_id, query)
+
+    def record(self, record):
+        with self.lock:
+            self.records.append(record)
+
+    def snapshot(self):
+        with self.lock:
+            return list(self.records)
+
+    def histogram(self):
+        """Return {phase: {"n", "p50_ms", "p95_ms", "max_ms"}} over the rolling window."""
+        durations = defaultdict(list)
+        for record in self.snapshot():
+            durations[record.phase].append(record.duration * 1000)
+        return {
+            phase: {
+                "n": len(samples),
+                "p50_ms": percentile(samples, 0.5),
+                "p95_ms": percentile(samples, 0.95),
+                "max_ms": max(samples),
+            }
+            for phase, samples in sorted(durations.items())
+        }
+
+    def export(self, path):
+        """Write the recorded spans to path: Chrome trace for .json, else JSON lines."""
+        records = self.snapshot()
+        if path.lower().endswith(".json"):
+            events = [
+                {
+                    "name": record.phase,
+                    "ph": "X",
+                    "ts": round(record.start * 1e6),
+                    "dur": round(record.duration * 1e6),
+                    "pid": os.getpid(),
+                    "tid": record.thread,
+                    "args": {"search_id": record.search_id, "query": record.query},
+                }
+                for record in records
+            ]
+            data = json.dumps({"traceEvents": events})
+        else:
+            data = "".join(
+                json.dumps(
+                    {
+                        "phase": record.phase,
+                        "start": record.start,
+                        "duration_ms": record.duration * 1000,
+                        "search_id": record.search_id,
+                        "query": record.query,
+                        "thread": record.thread,
+                    }
+                )
+                + "\n"
+                for record in records
+            )
+        atomic_write_bytes(path, data.encode("utf-8"))
+        return len(records)
+
+
+telemetry = Telemetry()
+
+
+# ---
+# Local Symbol Index
+# ---
+def normalize_search_text(text):
+    """Lowercase text and reduce it to space-separated word tokens."""
+    return " ".join(re.sub(r"[\W_]+", " ", str(text).lower()).split())
+
+
+def sort_tokens(text):
+    """Preprocess text the way fuzz.token_sort_ratio does before comparing."""
+    return " ".join(sorted(fuzz_utils.full_process(text, force_ascii=True).split()))
+
+
+def bulk_token_sort_scores(query, sorted_terms):
+    """Score query against many pre-sorted strings with token_sort_ratio semantics.
+
+    Uses a single rapidfuzz cdist call when rapidfuzz is installed, otherwise
+    plain fuzz.ratio over the already tokenized and sorted strings.
+    """
+    sorted_query = sort_tokens(query)
+    if not sorted_query or not sorted_terms:
+        return np.zeros(len(sorted_terms), dtype=np.int64)
+    if rapid_process is not None:
+        scores = rapid_process.cdist(
+            [sorted_query], sorted_terms, scorer=rapid_fuzz.ratio, workers=1
+        )[0]
+        # fuzzywuzzy returns rounded integers; round the same way so ties match.
+        return np.rint(scores).astype(np.int64)
+    return np.fromiter(
+        (fuzz.ratio(sorted_query, term) if term else 0 for term in sorted_terms),
+        dtype=np.int64,
+        count=len(sorted_terms),
+    )
+
+
+def match_score(query, name):
+    """Score one candidate name against query like the local indexes do."""
+    return int(bulk_token_sort_scores(query, [sort_tokens(name)])[0])
+
+
+def top_k_positions(scores, k):
+    """Return the indices of the k highest scores, ties going to the lower index."""
+    if len(scores) > k:
+        threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+        keep = np.flatnonzero(scores >= threshold)
+    else:
+        keep = np.arange(len(scores))
+    order = np.lexsort((keep, -scores[keep]))
+    return keep[order[:k]]
+
+
+def field_terms(position, field_values, field_weights):
+    """Return (entry position, text, weight) search terms for one catalog row."""
+    terms = []
+    for field, weight in field_weights.items():
+        for text in field_values.get(field, ()):
+            text = str(text).strip()
+            if text:
+                terms.append((position, text, weight))
+    return terms
+
+
+def mulberry_name_text(name):
+    """Turn a Mulberry file name like "drink_2_,_to" into search text ("drink")."""
+    text = str(name).replace("_", " ").replace(" , to", " ")
+    return " ".join(
+        token for token in text.split() if not re.fullmatch(r"\d+[a-z]?", token)
+    )
+
+
+def mulberry_catalog_entries(df):
+    entries, terms = [], []
+    for position, row in df.iterrows():
+        name = row["symbol-en"]
+        entries.append(
+            {
+                "name": name,
+                "path": os.path.join(MULBERRY_SYMBOLS_DIR, f"{name}.svg"),
+                "grammar": None if pd.isna(row["grammar"]) else row["grammar"],
+            }
+        )
+        fields = {
+            "symbol-en": [mulberry_name_text(name)],
+            "tags": [] if pd.isna(row["tags"]) else str(row["tags"]).split(),
+            "category-en": [] if pd.isna(row["category-en"]) else [row["category-en"]],
+        }
+        terms.extend(field_terms(position, fields, MULBERRY_FIELD_WEIGHTS))
+    return entries, terms
+
+
+def openmoji_catalog_entries(df):
+    # Skin tone variants only differ from their base emoji by the tone, so
+    # they are folded into the base entry instead of filling result slots.
+    bases = set(df["hexcode"])
+    df = df[
+        df["skintone"].isna() | ~df["skintone_base_hexcode"].isin(bases)
+    ].reset_index(drop=True)
+    entries, terms = [], []
+    for position, row in df.iterrows():
+        entries.append(
+            {
+                "name": row["annotation"],
+                "path": os.path.join(OPENMOJI_EMOJI_DIR, f"{row['hexcode']}.png"),
+            }
+        )
+        fields = {
+            "annotation": [row["annotation"]],
+            "tags": [] if pd.isna(row["tags"]) else str(row["tags"]).split(","),
+            "openmoji_tags": (
+                []
+                if pd.isna(row["openmoji_tags"])
+                else str(row["openmoji_tags"]).split(",")
+            ),
+            "subgroups": (
+                []
+                if pd.isna(row["subgroups"])
+                else [row["subgroups"].replace("-", " ")]
+            ),
+            "group": [] if pd.isna(row["group"]) else [row["group"].replace("-", " ")],
+        }
+        terms.extend(field_terms(position, fields, OPENMOJI_FIELD_WEIGHTS))
+    return entries, terms
+
+
+def vocab_grammar(tags):
+    """Return the Mulberry grammar values allowed by a vocab row's part-of-speech tag."""
+    if pd.isna(tags):
+        return None
+    for tag in str(tags).split():
+        grammar = VOCAB_POS_GRAMMAR.get(tag.split("::")[0])
+        if grammar:
+            return grammar
+    return None
+
+
+class WordVectors:
+    """Static word embeddings with unit-length rows, e.g. GloVe or fastText.
+
+    The text file is parsed once into CACHE_DIR as a .npy matrix plus a word
+    list and memory-mapped on later runs.
+    """
+
+    def __init__(self, words, matrix, stamp):
+        self.words = words
+        self.matrix = matrix
+        self.stamp = stamp
+        self.positions = {word: i for i, word in enumerate(words)}
+
+    @classmethod
+    def load(cls, path):
+        stat = os.stat(path)
+        stamp = [os.path.abspath(path), stat.st_mtime_ns, stat.st_size]
+        matrix_path = os.path.join(CACHE_DIR, "word-vectors.npy")
+        words_path = os.path.join(CACHE_DIR, "word-vectors.json")
+        try:
+            with open(words_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached["stamp"] == stamp:
+                matrix = np.load(matrix_path, mmap_mode="r")
+                return cls(cached["words"], matrix, stamp)
+        except (OSError, ValueError, KeyError):
+            pass
+        words, rows = [], []
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                parts = line.rstrip().split(" ")
+                if len(parts) <= 2:  # fastText header: "<count> <dimensions>"
+                    continue
+                words.append(parts[0])
+                rows.append(np.asarray(parts[1:], dtype=np.float32))
+        matrix = np.vstack(rows)
+        matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            np.save(matrix_path, matrix)
+            atomic_write_bytes(
+                words_path, json.dumps({"stamp": stamp, "words": words}).encode()
+            )
+        except OSError as e:
+            print(f"Could not write word vector cache: {e}")
+        return cls(words, matrix, stamp)
+
+    def embed_many(self, texts):
+        """Return unit mean-of-word vectors for texts; rows without known words are zero."""
+        embedded = np.zeros((len(texts), self.matrix.shape[1]), dtype=np.float32)
+        for row, text in enumerate(texts):
+            known = [
+                self.positions[token]
+                for token in normalize_search_text(text).split()
+                if token in self.positions
+            ]
+            if known:
+                vector = self.matrix[known].mean(axis=0)
+                embedded[row] = vector / max(np.linalg.norm(vector), 1e-12)
+        return embedded
+
+
+_word_vectors = None
+_word_vectors_lock = threading.Lock()
+
+
+def load_word_vectors(path=WORD_VECTORS_PATH):
+    """Return the configured WordVectors, or None when semantic search is off."""
+    global _word_vectors
+    if not path:
+        return None
+    with _word_vectors_lock:
+        if _word_vectors is None:
+            try:
+                _word_vectors = WordVectors.load(path)
+            except (OSError, ValueError) as e:
+                print(f"Semantic search disabled, could not load {path}: {e}")
+                _word_vectors = False
+    return _word_vectors or None
+
+
+class SymbolIndex:
+    """Pre-tokenized search terms of a local symbol catalog, cached on disk.
+
+    Each catalog entry contributes weighted search terms, one per field value
+    (name, tags, category, ...). Search fuzzy-scores every term, weights each
+    score by its field, and ranks every entry by its best term, so each
+    result is a distinct symbol. Rankings are the same with or without
+    rapidfuzz, which only makes the scan faster (about 1 ms instead of 20 ms
+    over OpenMoji). When word vectors are configured, each term also gets an
+    embedding, and a term's score is the higher of its fuzzy score and its
+    scaled cosine similarity.
+    """
+
+    FORMAT_VERSION = 5
+
+    def __init__(self, entries, terms):
+        self.entries = entries
+        self.term_entries = np.array([position for position, _, _ in terms])
+        self.term_weights = np.array([weight for _, _, weight in terms])
+        self.search_terms = [str(text) for _, text, _ in terms]
+        self.sorted_terms = [sort_tokens(term) for term in self.search_terms]
+        self.word_vectors = None
+        self.vectors = None
+
+    @classmethod
+    def load(cls, name, csv_path, build_entries):
+        """Load the on-disk index for csv_path, rebuilding it if the CSV changed."""
+        stat = os.stat(csv_path)
+        stamp = (
+            cls.FORMAT_VERSION,
+            os.path.abspath(csv_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        cache_path = os.path.join(CACHE_DIR, f"{name}.index.pkl")
+        index = None
+        try:
+            with open(cache_path, "rb") as f:
+                cached_stamp, state = pickle.load(f)
+            if cached_stamp == stamp:
+                index = cls.__new__(cls)
+                index.__dict__.update(state)
+        except Exception:
+            pass
+        if index is None:
+            entries, terms = build_entries(pd.read_csv(csv_path))
+            index = cls(entries, terms)
+            try:
+                atomic_write_bytes(cache_path, pickle.dumps((stamp, index.__dict__)))
+            except OSError as e:
+                print(f"Could not write {name} index cache: {e}")
+        index.attach_vectors(name, stamp, load_word_vectors())
+        return index
+
+    def attach_vectors(self, name, stamp, word_vectors):
+        """Load or build the catalog embedding matrix saved as CACHE_DIR/<name>.vectors.npy."""
+        if word_vectors is None:
+            return
+        matrix_path = os.path.join(CACHE_DIR, f"{name}.vectors.npy")
+        stamp_path = os.path.join(CACHE_DIR, f"{name}.vectors.json")
+        vectors_stamp = [list(stamp), word_vectors.stamp]
+        try:
+            with open(stamp_path, "r", encoding="utf-8") as f:
+                if json.load(f) == vectors_stamp:
+                    self.vectors = np.load(matrix_path)
+        except (OSError, ValueError):
+            pass
+        if self.vectors is None:
+            self.vectors = word_vectors.embed_many(self.search_terms)
+            try:
+                np.save(matrix_path, self.vectors)
+                atomic_write_bytes(stamp_path, json.dumps(vectors_stamp).encode())
+            except OSError as e:
+                print(f"Could not write {name} vectors cache: {e}")
+        self.word_vectors = word_vectors
+
+    def score(self, query, grammar=None):
+        """Return (entry positions, scores) for every entry with search terms.
+
+        Entries whose known grammar is not in grammar are down-weighted.
+        """
+        scores = bulk_token_sort_scores(query, self.sorted_terms) * self.term_weights
+        if self.vectors is not None:
+            query_vector = self.word_vectors.embed_many([query])[0]
+            if query_vector.any():
+                similarity = self.vectors @ query_vector
+                semantic = similarity * 100 * SEMANTIC_WEIGHT * self.term_weights
+                scores = np.maximum(scores, semantic)
+        entry_positions, term_rows = np.unique(self.term_entries, return_inverse=True)
+        best = np.zeros(len(entry_positions))
+        np.maximum.at(best, term_rows, scores)
+        if grammar:
+            mismatched = np.fromiter(
+                (
+                    self.entries[position].get("grammar") not in (None, *grammar)
+                    for position in entry_positions
+                ),
+                dtype=bool,
+                count=len(entry_positions),
+            )
+            best[mismatched] *= POS_MISMATCH_WEIGHT
+        return entry_positions, np.rint(best).astype(np.int64)
+
+    def iter_ranked(self, query, depth=RESULTS_PER_SOURCE, grammar=None):
+        """Yield up to depth entries best first.
+
+        Only the top depth scores are kept past the first step, so a stream
+        suspended in a memo holds no catalog-sized arrays.
+        """
+        positions, scores = self.score(query, grammar)
+        top = top_k_positions(scores, depth)
+        positions, scores = positions[top], scores[top]
+        for position, score in zip(positions.tolist(), scores.tolist()):
+            yield {**self.entries[position], "score": score}
+
+
+def guarded_results(source, results):
+    """Yield from a source's result iterator, logging and stopping at the first error."""
+    try:
+        yield from results
+    except RequestCancelled:
+        return
+    except Exception as e:
+        print(f"Error searching {source}: {e}")
+
+
+def split_english_text(raw_text):
+    """Split an `english` gloss into the alternative words offered for search."""
+    if pd.isna(raw_text):
+        return ["(No Word)"]
+    processed_text = (
+        str(raw_text)
+        .replace("(", ",")
+        .replace(")", "")
+        .replace(" or ", ",")
+        .replace(";", ",")
+    )
+    words = [word.strip() for word in processed_text.split(",") if word.strip()]
+    return words or ["(Empty)"]
+
+
+class BudgetLRU:
+    """Thread-safe LRU mapping that evicts its oldest entries past a byte budget."""
+
+    def __init__(self, budget, size_of):
+        self.budget = budget
+        self.size_of = size_of
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.entries
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key not in self.entries:
+                return default
+            self.entries.move_to_end(key)
+            return self.entries[key][0]
+
+    def put(self, key, value):
+        size = self.size_of(value)
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)[1]
+            self.entries[key] = (value, size)
+            self.total_bytes += size
+            while self.total_bytes > self.budget and len(self.entries) > 1:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+
+
+def image_nbytes(image):
+    return image.width * image.height * len(image.getbands())
+
+
+# ---
+# Query Normalization
+# ---
+QUERY_ARTICLES = ("a", "an", "the")
+IRREGULAR_LEMMAS = {
+    "am": "be",
+    "are": "be",
+    "is": "be",
+    "was": "be",
+    "were": "be",
+    "been": "be",
+    "has": "have",
+    "had": "have",
+    "does": "do",
+    "did": "do",
+    "went": "go",
+    "children": "child",
+    "people": "person",
+    "men": "man",
+    "women": "woman",
+    "feet": "foot",
+    "teeth": "tooth",
+    "mice": "mouse",
+}
+
+
+def lemmatize_token(token):
+    """Return the dictionary form of a token from the irregular-forms table.
+
+    Only listed forms are changed: suffix rules turn too many words into
+    non-words ("christmas", "pants", "clothes").
+    """
+    if token.endswith("'s"):
+        token = token[:-2]
+    return IRREGULAR_LEMMAS.get(token, token)
+
+
+def normalize_query(text):
+    """Reduce a gloss to the canonical form used to key and compare queries.
+
+    Case-folds, drops parentheticals, punctuation, a leading infinitive "to"
+    and leading articles, and maps irregular forms, so "To Be", "is" and
+    "be (v.)" all become "be".
+    """
+    text = str(text).casefold()
+    words = re.sub(r"[^\w']+", " ", re.sub(r"\([^)]*\)", " ", text)).split()
+    if not words:
+        words = re.sub(r"[^\w']+", " ", text).split()
+    tokens = [token for token in (word.strip("'") for word in words) if token]
+    if len(tokens) > 1 and tokens[0] == "to":
+        tokens = tokens[1:]
+    while len(tokens) > 1 and tokens[0] in QUERY_ARTICLES:
+        tokens = tokens[1:]
+    return " ".join(lemmatize_token(token) for token in tokens)
+
+
+class MemoizedResults:
+    """Replays a ranked result iterator, pulling each result from it only once.
+
+    Any number of readers, on any threads, may iterate concurrently; results
+    are fetched lazily, so a memoized stream costs no more than the deepest
+    read of it. At most limit results are kept, and the iterator is released
+    once it is exhausted, capped or has failed. failed is set if the
+    underlying iterator raised.
+    """
+
+    def __init__(self, results, limit=RESULTS_PER_SOURCE):
+        self.results = results
+        self.limit = limit
+        self.items = []
+        self.done = False
+        self.failed = False
+        self.lock = threading.Lock()
+
+    def finish(self):
+        self.done = True
+        close = getattr(self.results, "close", None)
+        if close is not None:
+            close()
+        self.results = None
+
+    def __iter__(self):
+        position = 0
+        while True:
+            with self.lock:
+                if position == len(self.items):
+                    if self.done:
+                        return
+                    try:
+                        self.items.append(next(self.results))
+                    except StopIteration:
+                        self.finish()
+                        return
+                    except Exception:
+                        self.failed = True
+                        self.finish()
+                        raise
+                    if len(self.items) >= self.limit:
+                        self.finish()
+                item = self.items[position]
+            position += 1
+            yield item
+
+
+class SearchMemo:
+    """Bounded LRU of ranked results per (source, normalized query, grammar).
+
+    A miss searches with the normalized query, so every query sharing an
+    entry gets the same results whichever of them came first. A failed
+    search is not kept, so the next lookup retries it. hits and misses count
+    lookups per source.
+    """
+
+    def __init__(self, capacity=QUERY_MEMO_ENTRIES):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = Counter()
+        self.misses = Counter()
+        self.lock = threading.Lock()
+
+    def results(self, source, query, search_func, grammar=None):
+        """Iterate source's results for query, calling search_func(query) on a miss."""
+        normalized = normalize_query(query)
+        key = (source, normalized, grammar)
+        with self.lock:
+            memoized = self.entries.get(key)
+            if memoized is not None and not memoized.failed:
+                self.entries.move_to_end(key)
+                self.hits[source] += 1
+            else:
+                self.misses[source] += 1
+                memoized = MemoizedResults(iter(search_func(normalized)))
+                self.entries[key] = memoized
+                while len(self.entries) > self.capacity:
+                    self.entries.popitem(last=False)
+        return iter(memoized)
+
+    def stats(self):
+        """Return {source: (hits, misses)} for every source looked up so far."""
+        with self.lock:
+            return {
+                source: (self.hits[source], self.misses[source])
+                for source in sorted(set(self.hits) | set(self.misses))
+            }
+
+
+# ---
+# Thumbnail Cache
+# ---
+def thumbnail_key(path, size, mtime_ns=None):
+    if mtime_ns is None:
+        mtime_ns = os.stat(path).st_mtime_ns
+    raw = f"{os.path.abspath(path)}|{mtime_ns}|{size}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def render_thumbnail(path, size):
+    """Rasterize an SVG, or resize a bitmap, to size x size PNG bytes."""
+    if path.lower().endswith(".svg"):
+        return cairosvg.svg2png(url=path, output_width=size, output_height=size)
+    with Image.open(path) as image:
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        thumbnail = image.resize((size, size), Image.LANCZOS)
+    buffer = BytesIO()
+    thumbnail.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+class ThumbnailCache:
+    """Two-level cache of rendered symbol thumbnails.
+
+    Decoded images are kept in an in-memory LRU bounded by a byte budget and
+    the PNG bytes are stored under THUMBNAIL_CACHE_DIR, keyed by source path,
+    mtime and size, so each symbol is rasterized once per size across sessions.
+    """
+
+    def __init__(
+        self, cache_dir=THUMBNAIL_CACHE_DIR, memory_budget=THUMBNAIL_MEMORY_BUDGET
+    ):
+        self.cache_dir = cache_dir
+        self.memory = BudgetLRU(memory_budget, image_nbytes)
+
+    def disk_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.png")
+
+    def get(self, path, size):
+        """Return the symbol at path as a PIL image of size x size pixels."""
+        key = thumbnail_key(path, size)
+        image = self.memory.get(key)
+        if image is not None:
+            return image
+        disk_path = self.disk_path(key)
+        try:
+            with open(disk_path, "rb") as f:
+                png_data = f.read()
+        except FileNotFoundError:
+            png_data = render_thumbnail(path, size)
+            try:
+                atomic_write_bytes(disk_path, png_data)
+            except OSError as e:
+                print(f"Could not write thumbnail cache entry for {path}: {e}")
+        image = Image.open(BytesIO(png_data))
+        image.load()
+        self.memory.put(key, image)
+        return image
+
+
+# ---
+# Offline Pre-rendering
+# ---
+PRERENDER_MANIFEST = os.path.join(THUMBNAIL_CACHE_DIR, "prerender-manifest.json")
+
+
+def prerender_symbol(path, sizes, cache_dir=THUMBNAIL_CACHE_DIR):
+    """Render one symbol into the on-disk thumbnail cache at every given size."""
+    import_heavy_modules()
+    cache = ThumbnailCache(cache_dir)
+    mtime_ns = os.stat(path).st_mtime_ns
+    for size in sizes:
+        disk_path = cache.disk_path(thumbnail_key(path, size, mtime_ns))
+        if not os.path.exists(disk_path):
+            atomic_write_bytes(disk_path, render_thumbnail(path, size))
+    return mtime_ns
+
+
+def prerender_library(sizes=None, workers=None):
+    """Pre-render the bundled Mulberry and OpenMoji symbols into the thumbnail cache.
+
+    Runs across a process pool and only renders files whose mtime differs
+    from the previous run's manifest, deleting their outdated thumbnails.
+    """
+    sizes = sorted(set(sizes or ICON_SIZE_MAP.values()))
+    try:
+        with open(PRERENDER_MANIFEST, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+    if manifest.get("sizes") != sizes:
+        manifest = {"sizes": sizes, "files": {}}
+    rendered = manifest["files"]
+    cache = ThumbnailCache()
+    pending = []
+    for directory, extension in (
+        (MULBERRY_SYMBOLS_DIR, ".svg"),
+        (OPENMOJI_EMOJI_DIR, ".png"),
+    ):
+        for entry in os.scandir(directory):
+            if not entry.name.lower().endswith(extension):
+                continue
+            previous_mtime = rendered.get(entry.path)
+            if previous_mtime == entry.stat().st_mtime_ns:
+                continue
+            if previous_mtime is not None:
+                for size in sizes:
+                    stale_path = cache.disk_path(
+                        thumbnail_key(entry.path, size, previous_mtime)
+                    )
+                    if os.path.exists(stale_path):
+                        os.remove(stale_path)
+            pending.append(entry.path)
+    print(f"Pre-rendering {len(pending)} symbols at sizes {sizes}...")
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            path: executor.submit(prerender_symbol, path, sizes) for path in pending
+        }
+        for done, (path, future) in enumerate(futures.items(), start=1):
+            try:
+                rendered[path] = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"Error pre-rendering '{path}': {e}")
+            if done % 500 == 0:
+                print(f"  {done}/{len(pending)}")
+    atomic_write_bytes(PRERENDER_MANIFEST, json.dumps(manifest).encode("utf-8"))
+    print(f"Done: {len(pending) - failed} rendered, {failed} failed.")
+
+
+# ---
+# Remote Sources
+# ---
+CachedResponse = namedtuple(
+    "CachedResponse", ["path", "etag", "last_modified", "fresh"]
+)
+# Set by RemoteSearchEngine for the requests of one search; once the event is
+# set, HttpClient.get abandons the request at its next chunk.
+http_cancel_event = contextvars.ContextVar("http_cancel_event", default=None)
+
+
+class RequestCancelled(Exception):
+    """Raised by HttpClient.get when the search that issued it was cancelled."""
+
+
+class HttpCache:
+    """Persistent, content-addressed cache of HTTP response bodies.
+
+    An SQLite table maps each URL to the SHA-256 of its body and its
+    ETag/Last-Modified validators; each distinct body is stored once under
+    blobs/. Entries older than the TTL are revalidated before reuse, and once
+    the cache outgrows its size budget expired entries are evicted first,
+    then the least recently used ones.
+    """
+
+    def __init__(
+        self,
+        cache_dir=HTTP_CACHE_DIR,
+        ttl=HTTP_CACHE_TTL,
+        max_bytes=HTTP_CACHE_MAX_BYTES,
+    ):
+        self.blob_dir = os.path.join(cache_dir, "blobs")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            os.path.join(cache_dir, "responses.sqlite3"), check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )""")
+        self.connection.commit()
+
+    def blob_path(self, digest):
+        return os.path.join(self.blob_dir, digest[:2], digest)
+
+    def lookup(self, url):
+        """Return the CachedResponse for url, or None if it is not cached."""
+        now = time.time()
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT digest, etag, last_modified, fetched_at FROM responses"
+                " WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url)
+            )
+            self.connection.commit()
+        digest, etag, last_modified, fetched_at = row
+        path = self.blob_path(digest)
+        if not os.path.exists(path):
+            return None
+        return CachedResponse(path, etag, last_modified, now - fetched_at < self.ttl)
+
+    def touch(self, url):
+        """Mark a revalidated entry as freshly fetched."""
+        with self.lock:
+            self.connection.execute(
+                "UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url)
+            )
+            self.connection.commit()
+
+    def store(self, url, content, headers):
+        """Store a response body for url and return its CachedResponse."""
+        digest = hashlib.sha256(content).hexdigest()
+        path = self.blob_path(digest)
+        if not os.path.exists(path):
+            atomic_write_bytes(path, content)
+        now = time.time()
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, digest, len(content), etag, last_modified, now, now),
+            )
+            self.connection.commit()
+            self.evict()
+        return CachedResponse(path, etag, last_modified, True)
+
+    def evict(self):
+        """Drop entries until the distinct blobs fit the byte budget."""
+        (total,) = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM"
+            " (SELECT digest, MAX(size) AS size FROM responses GROUP BY digest)"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        expired_before = time.time() - self.ttl
+        candidates = self.connection.execute(
+            "SELECT url, digest, size FROM responses"
+            " ORDER BY fetched_at < ? DESC, accessed_at ASC",
+            (expired_before,),
+        ).fetchall()
+        for url, digest, size in candidates:
+            if total <= self.max_bytes * 0.9:
+                break
+            self.connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+            still_used = self.connection.execute(
+                "SELECT 1 FROM responses WHERE digest = ? LIMIT 1", (digest,)
+            ).fetchone()
+            if not still_used:
+                total -= size
+                try:
+                    os.remove(self.blob_path(digest))
+                except FileNotFoundError:
+                    pass
+        self.connection.commit()
+
+
+class HttpClient:
+    """Shared HTTP layer for the remote symbol sources.
+
+    Wraps one keep-alive requests.Session with a connection pool, retries with
+    exponential backoff on 429/5xx responses, a cap on concurrent requests per
+    host, and a thread pool for fetching result images in parallel.
+    """
+
+    def __init__(
+        self,
+        pool_size=HTTP_POOL_SIZE,
+        max_per_host=HTTP_MAX_PER_HOST,
+        retries=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        cache=None,
+        offline=OFFLINE_MODE,
+    ):
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.max_per_host = max_per_host
+        self.host_slots = {}
+        self.host_slots_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=pool_size)
+        self.cache = cache
+        self.offline = offline
+
+    def host_slot(self, url):
+        host = urlsplit(url).netloc
+        with self.host_slots_lock:
+            if host not in self.host_slots:
+                self.host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self.host_slots[host]
+
+    def get(self, url, **kwargs):
+        """GET url through the shared session, raising on an error status.
+
+        Inside a cancellable search (see http_cancel_event) the body is read
+        in chunks, and the request is dropped as soon as the search is
+        cancelled, whether still waiting for a host slot or mid-download.
+        """
+        kwargs.setdefault("timeout", HTTP_TIMEOUT)
+        cancel_event = http_cancel_event.get()
+        with self.host_slot(url):
+            if cancel_event is None:
+                response = self.session.get(url, **kwargs)
+            else:
+                if cancel_event.is_set():
+                    raise RequestCancelled(url)
+                response = self.session.get(url, stream=True, **kwargs)
+                with response:
+                    chunks = []
+                    for chunk in response.iter_content(HTTP_CHUNK_SIZE):
+                        if cancel_event.is_set():
+                            raise RequestCancelled(url)
+                        chunks.append(chunk)
+                    response._content = b"".join(chunks)
+        response.raise_for_status()
+        return response
+
+    def fetch(self, url, params=None, headers=None):
+        """Return the body of url, served from the response cache when possible."""
+        if self.cache is None:
+            if self.offline:
+                raise requests.ConnectionError(f"Offline, not fetching {url}")
+            return self.get(url, params=params, headers=headers).content
+        with open(self.fetch_cached(url, params, headers), "rb") as f:
+            return f.read()
+
+    def fetch_cached(self, url, params=None, headers=None):
+        """Return the path of the cached body of url, revalidating it when stale."""
+        if params:
+            url = requests.Request("GET", url, params=params).prepare().url
+        entry = self.cache.lookup(url)
+        if entry is not None and (entry.fresh or self.offline):
+            return entry.path
+        if self.offline:
+            raise requests.ConnectionError(f"Offline and not cached: {url}")
+        request_headers = dict(headers or {})
+        if entry is not None and entry.etag:
+            request_headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            request_headers["If-Modified-Since"] = entry.last_modified
+        response = self.get(url, headers=request_headers)
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(url)
+            return entry.path
+        return self.cache.store(url, response.content, response.headers).path
+
+    def map_ordered(self, func, items):
+        """Run func over items concurrently, yielding (item, result, error) in order.
+
+        Work that has not started yet is cancelled if the caller stops iterating.
+        """
+        futures = [
+            (item, self.executor.submit(contextvars.copy_context().run, func, item))
+            for item in items
+        ]
+        try:
+            for item, future in futures:
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, e
+        finally:
+            for _, future in futures:
+                future.cancel()
+
+
+def download_symbol_image(http_client, url):
+    """Download a remote symbol, returning its raw bytes and the decoded image."""
+    image_data = http_client.fetch(url)
+    image = Image.open(BytesIO(image_data))
+    image.load()
+    return image_data, image
+
+
+def search_results_nbytes(cached_search):
+    _, results = cached_search
+    total = 0
+    for entries in results.values():
+        for _, data, data_type, image in entries:
+            total += image_nbytes(image)
+            if data_type == "png_data":
+                total += len(data)
+    return total
+
+
+class RemoteSearchEngine:
+    """Runs remote searches as asyncio tasks on one background event loop.
+
+    Blocking HTTP work goes to a fixed pool of worker threads, so the number
+    of threads stays bounded however fast the user changes words.
+    cancel_before() cancels every task of older searches: queued requests
+    never start and in-flight downloads stop at their next chunk.
+    """
+
+    def __init__(self, workers=REMOTE_SEARCH_WORKERS):
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.searches = {}
+        self.lock = threading.Lock()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+
+    def submit(self, search_id, coroutine_function, *args):
+        """Schedule coroutine_function(*args) as part of search search_id."""
+        with self.lock:
+            cancel_event, futures = self.searches.setdefault(
+                search_id, (threading.Event(), set())
+            )
+        future = asyncio.run_coroutine_threadsafe(
+            self.run_cancellable(cancel_event, coroutine_function(*args)), self.loop
+        )
+        with self.lock:
+            futures.add(future)
+        future.add_done_callback(lambda done: self.forget(search_id, done))
+        return future
+
+    async def run_cancellable(self, cancel_event, coroutine):
+        http_cancel_event.set(cancel_event)
+        return await coroutine
+
+    async def run_blocking(self, func, *args):
+        """Run a blocking call on the worker pool, inside the calling search."""
+        context = contextvars.copy_context()
+        return await self.loop.run_in_executor(
+            self.executor, lambda: context.run(func, *args)
+        )
+
+    def forget(self, search_id, future):
+        with self.lock:
+            entry = self.searches.get(search_id)
+            if entry is None:
+                return
+            entry[1].discard(future)
+            if not entry[1]:
+                del self.searches[search_id]
+
+    def cancel_before(self, search_id):
+        """Cancel every task belonging to a search older than search_id."""
+        with self.lock:
+            stale = [
+                self.searches.pop(stale_id)
+                for stale_id in list(self.searches)
+                if stale_id < search_id
+            ]
+        for cancel_event, futures in stale:
+            cancel_event.set()
+            for future in list(futures):
+                future.cancel()
+
+
+# ---
+# Deck Persistence
+# ---
+def ensure_symbol_columns(df):
+    """Add any missing symbol columns and make them hold arbitrary Python values."""
+    for col in SYMBOL_COLUMNS:
+        if col not in df.columns:
+            df[col] = pd.NA
+        df[col] = df[col].astype(object)
+    return df
+
+
+def write_deck_csv(df, path):
+    """Atomically replace path with df as CSV, fsyncing before the rename."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            df.to_csv(f, index=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, file_mode_for(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def deck_column_names(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".parquet":
+        import pyarrow.parquet
+
+        return pyarrow.parquet.read_schema(path).names
+    if extension == ".feather":
+        import pyarrow.ipc
+
+        with pyarrow.ipc.open_file(path) as reader:
+            return reader.schema.names
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def read_deck_columns(path, columns):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".parquet":
+        return pd.read_parquet(path, columns=columns)
+    if extension == ".feather":
+        return pd.read_feather(path, columns=columns)
+    return pd.read_csv(path, usecols=columns)[columns]
+
+
+def read_deck(path, columns=None):
+    """Read a CSV, Parquet or Feather deck.
+
+    When columns is given only those are loaded; the others stay on disk and
+    are pulled in by deck_column() or when the deck is written out.
+    """
+    names = deck_column_names(path)
+    wanted = names if columns is None else [c for c in names if c in columns]
+    df = read_deck_columns(path, wanted)
+    df.attrs["deck_source"] = os.path.abspath(path)
+    df.attrs["column_order"] = names
+    df.attrs["lazy_columns"] = [c for c in names if c not in wanted]
+    return df
+
+
+def deck_column(df, name):
+    """Return a deck column, loading it from the deck file on first use."""
+    lazy_columns = df.attrs.get("lazy_columns", [])
+    if name in lazy_columns:
+        column = read_deck_columns(df.attrs["deck_source"], [name])[name]
+        df[name] = column.to_numpy()
+        df.attrs["lazy_columns"] = [c for c in lazy_columns if c != name]
+    return df[name]
+
+
+def materialize_deck(df):
+    """Return df with every lazily skipped column loaded, in the file's order."""
+    lazy_columns = df.attrs.get("lazy_columns")
+    if not lazy_columns:
+        return df
+    extra = read_deck_columns(df.attrs["deck_source"], lazy_columns)
+    full_df = df.copy()
+    for col in lazy_columns:
+        full_df[col] = extra[col].to_numpy()
+    order = df.attrs["column_order"]
+    return full_df[order + [c for c in full_df.columns if c not in order]]
+
+
+def write_deck(df, path):
+    """Atomically write a full deck to path in the format its extension names."""
+    full_df = materialize_deck(df)
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in DECK_BINARY_FORMATS:
+        write_deck_csv(full_df, path)
+        return
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        full_df = full_df.reset_index(drop=True)
+        if extension == ".parquet":
+            full_df.to_parquet(tmp_path, index=False)
+        else:
+            full_df.to_feather(tmp_path)
+        os.chmod(tmp_path, file_mode_for(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def resolve_vocab_path(path=VOCAB_DECK_PATH):
+    """Prefer an up-to-date Parquet/Feather copy of the vocab CSV when one exists."""
+    base, _ = os.path.splitext(path)
+    for extension in DECK_BINARY_FORMATS:
+        candidate = base + extension
+        if os.path.exists(candidate) and (
+            not os.path.exists(path)
+            or os.path.getmtime(candidate) >= os.path.getmtime(path)
+        ):
+            return candidate
+    return path
+
+
+class DeckJournal:
+    """Append-only write-ahead log of symbol picks for a deck CSV.
+
+    Each pick is one fsynced JSON line next to the deck, so saving a pick no
+    longer rewrites the whole CSV. compact() folds the log back into the CSV
+    with an atomic replace; a torn last line from a crash is ignored on replay.
+    """
+
+    def __init__(self, deck_path):
+        self.deck_path = deck_path
+        self.path = deck_path + DECK_JOURNAL_SUFFIX
+        self.pending = len(self.read_entries())
+
+    def read_entries(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+        return entries
+
+    def append(self, row_index, df):
+        entry = {"row": int(row_index)}
+        for col in SYMBOL_COLUMNS:
+            value = df.loc[row_index, col]
+            entry[col] = None if pd.isna(value) else value
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.pending += 1
+
+    def replay(self, df):
+        """Apply logged picks to df in order and return how many were applied."""
+        entries = self.read_entries()
+        if entries:
+            ensure_symbol_columns(df)
+        for entry in entries:
+            if 0 <= entry["row"] < len(df):
+                for col in SYMBOL_COLUMNS:
+                    value = entry.get(col)
+                    df.loc[entry["row"], col] = pd.NA if value is None else value
+        return len(entries)
+
+    def compact(self, df):
+        """Write df, which holds every logged pick, as the deck and clear the log."""
+        write_deck(df, self.deck_path)
+        self.discard()
+
+    def discard(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        self.pending = 0
+
+
+def create_deck(df, path):
+    """Write df as a new deck at path, replacing any deck and journal already there."""
+    DeckJournal(path).discard()
+    write_deck(df, path)
+
+
+# ---
+# Symbol Asset Store
+# ---
+class AssetStore:
+    """Content-addressed store for picked symbol images.
+
+    Each distinct image is written once as ASSET_STORE_DIR/<sha256[:2]>/<ref>,
+    where ref is "<sha256><ext>" and is what the deck records in symbol_asset.
+    The per-word names in SELECTED_SYMBOLS_DIR are hardlinks to those blobs,
+    or plain copies on filesystems without hardlinks, so tools reading the
+    folder directly still find every picked image.
+    """
+
+    def __init__(self, root=SELECTED_SYMBOLS_DIR, store_dir=ASSET_STORE_DIR):
+        self.root = root
+        self.store_dir = store_dir
+        self.file_refs = {}
+        self.lock = threading.Lock()
+
+    def blob_path(self, ref):
+        return os.path.join(self.store_dir, ref[:2], ref)
+
+    def put_bytes(self, data, extension):
+        """Store data if no identical image is stored yet and return its reference."""
+        ref = hashlib.sha256(data).hexdigest() + extension.lower()
+        path = self.blob_path(ref)
+        if not os.path.exists(path):
+            atomic_write_bytes(path, data)
+        return ref
+
+    def put_file(self, path):
+        """Store a local file, hashing each unchanged source file only once."""
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            ref = self.file_refs.get(key)
+        if ref is None or not os.path.exists(self.blob_path(ref)):
+            with open(path, "rb") as f:
+                ref = self.put_bytes(f.read(), os.path.splitext(path)[1])
+            with self.lock:
+                self.file_refs[key] = ref
+        return ref
+
+    def link(self, filename, ref):
+        """Point the per-word name filename at the stored blob ref."""
+        target = os.path.join(self.root, filename)
+        blob = self.blob_path(ref)
+        if os.path.exists(target) and os.path.samefile(target, blob):
+            return
+        tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            try:
+                os.link(blob, tmp_path)
+            except OSError:
+                shutil.copyfile(blob, tmp_path)
+            os.replace(tmp_path, target)
+        except OSError:
+            for path in (tmp_path, target):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def resolve(self, filename, ref=None):
+        """Return the on-disk path of a picked symbol, preferring its per-word name."""
+        path = os.path.join(self.root, filename)
+        if pd.notna(ref) and not os.path.exists(path):
+            return self.blob_path(ref)
+        return path
+
+    def adopt(self, filename):
+        """Move an existing per-word file into the store and return its reference."""
+        ref = self.put_file(os.path.join(self.root, filename))
+        self.link(filename, ref)
+        return ref
+
+    def export_flat(self, df, destination):
+        """Copy every picked symbol of df to destination under its per-word name."""
+        os.makedirs(destination, exist_ok=True)
+        copied = 0
+        for filename, ref in zip(df["symbol_filename"], df["symbol_asset"]):
+            if pd.isna(filename):
+                continue
+            try:
+                shutil.copyfile(
+                    self.resolve(filename, ref), os.path.join(destination, filename)
+                )
+                copied += 1
+            except OSError as e:
+                print(f"Could not export '{filename}': {e}")
+        return copied
+
+
+def sanitized_filename_word(word, row_index):
+    sanitized_word = "".join(x for x in word if x.isalnum())
+    return sanitized_word or f"entry{row_index}"
+
+
+def symbol_filename(word, row_index, symbol, source):
+    """Return the name a picked symbol is saved under in SELECTED_SYMBOLS_DIR."""
+    sanitized_word = sanitized_filename_word(word, row_index)
+    if "path" in symbol:
+        original_filename = os.path.basename(symbol["path"])
+        return f"{sanitized_word}_{source}_{original_filename}"
+    if "ARASAAC" in source:
+        pictogram_id = symbol["url"].split("/")[-1]
+        symbol_name_cleaned = (
+            "".join(c for c in symbol["name"] if c.isalnum() or c in (" ", "_", "-"))
+            .strip()
+            .replace(" ", "_")
+        )
+        return f"{sanitized_word}_{source}_{symbol_name_cleaned}_{pictogram_id}.png"
+    base_name = os.path.basename(symbol["url"].split("?")[0])
+    if not os.path.splitext(base_name)[1]:
+        base_name += ".png"
+    return f"{sanitized_word}_{source}_{base_name}"
+
+
+# ---
+# Deck Integrity
+# ---
+def verify_image_file(path):
+    """Raise unless path holds a complete, decodable PNG or SVG image."""
+    if path.lower().endswith(".svg"):
+        ElementTree.parse(path)
+        return
+    with Image.open(path) as image:
+        image.verify()
+
+
+class DeckIntegrityScan:
+    """Verifies every symbol file a deck references and restores broken ones.
+
+    run() stats each referenced file and decodes every distinct one once, on
+    a thread pool, so rows sharing a blob through hardlinks cost one check.
+    It reports references that are missing or corrupt and, on request, the
+    files under SELECTED_SYMBOLS_DIR or the asset store that no row of the
+    deck uses. Every deck shares that folder, so those files may well belong
+    to another deck.
+    repair() re-stores a pick from where it came from: the bundled library
+    for Mulberry and OpenMoji, a fresh download for ARASAAC.
+    """
+
+    def __init__(self, asset_store, http_client=None, workers=INTEGRITY_WORKERS):
+        self.asset_store = asset_store
+        self.http_client = http_client
+        self.workers = workers
+        self.limiter = RateLimiter(AUTOPICK_RATE_LIMITS.get("ARASAAC"))
+
+    def references(self, df):
+        """Yield (row, column, filename, path) for every file df points at."""
+        root = self.asset_store.root
+        for row, filename, asset in zip(
+            df.index, df["symbol_filename"], df["symbol_asset"]
+        ):
+            if pd.notna(filename):
+                path = self.asset_store.resolve(filename, asset)
+                yield row, "symbol_filename", filename, path
+        for row, filename in zip(df.index, df["sentence_symbol_filename"]):
+            if pd.notna(filename):
+                yield row, "sentence_symbol_filename", filename, os.path.join(
+                    root, filename
+                )
+
+    @staticmethod
+    def file_key(path):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def check_file(path):
+        """Return "ok", "missing" or "corrupt" for one image file."""
+        try:
+            verify_image_file(path)
+        except FileNotFoundError:
+            return "missing"
+        except Exception:
+            return "corrupt"
+        return "ok"
+
+    def orphans(self, df):
+        """Return the files in the symbols folder and asset store df never uses.
+
+        Other decks share the folder, so these are not safe to delete.
+        """
+        used_names = set(df["symbol_filename"].dropna())
+        used_names.update(df["sentence_symbol_filename"].dropna())
+        used_refs = set(df["symbol_asset"].dropna())
+        orphaned = []
+        if os.path.isdir(self.asset_store.root):
+            with os.scandir(self.asset_store.root) as entries:
+                orphaned.extend(
+                    entry.path
+                    for entry in entries
+                    if entry.is_file() and entry.name not in used_names
+                )
+        if os.path.isdir(self.asset_store.store_dir):
+            for prefix in os.scandir(self.asset_store.store_dir):
+                if not prefix.is_dir():
+                    continue
+                with os.scandir(prefix.path) as entries:
+                    orphaned.extend(
+                        entry.path
+                        for entry in entries
+                        if entry.is_file() and entry.name not in used_refs
+                    )
+        return sorted(orphaned)
+
+    def run(self, df, orphans=False):
+        """Check df's symbol files and return a report of what is broken.
+
+        With orphans, report["orphaned"] also lists the files df never uses.
+        """
+        references = list(self.references(df))
+        paths = [path for _, _, _, path in references]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            keys = list(executor.map(self.file_key, paths, chunksize=256))
+            distinct = {}
+            for key, path in zip(keys, paths):
+                if key is not None:
+                    distinct.setdefault(key, path)
+            statuses = dict(
+                zip(
+                    distinct,
+                    executor.map(self.check_file, distinct.values(), chunksize=64),
+                )
+            )
+        report = {"checked": len(references), "files": len(distinct)}
+        report["missing"] = []
+        report["corrupt"] = []
+        for (row, column, filename, _), key in zip(references, keys):
+            status = "missing" if key is None else statuses[key]
+            if status != "ok":
+                report[status].append((row, column, filename))
+        if orphans:
+            report["orphaned"] = self.orphans(df)
+        return report
+
+    def library_path(self, filename, source):
+        """Return the bundled file a Mulberry or OpenMoji pick was copied from."""
+        original_filename = filename.split(f"_{source}_", 1)[1]
+        if source == "Mulberry":
+            return os.path.join(MULBERRY_SYMBOLS_DIR, original_filename)
+        return os.path.join(OPENMOJI_EMOJI_DIR, original_filename)
+
+    def repair(self, filename, source, asset=None):
+        """Restore one missing or corrupt pick and return its asset reference."""
+        if pd.notna(asset):
+            blob_path = self.asset_store.blob_path(asset)
+            if self.check_file(blob_path) == "ok":
+                self.asset_store.link(filename, asset)
+                return asset
+            if os.path.exists(blob_path):
+                os.remove(blob_path)
+        if source in ("Mulberry", "OpenMoji"):
+            ref = self.asset_store.put_file(self.library_path(filename, source))
+        elif source == "ARASAAC" and self.http_client is not None:
+            pictogram_id = os.path.splitext(filename)[0].rsplit("_", 1)[-1]
+            self.limiter.wait()
+            ref = self.asset_store.put_bytes(
+                self.http_client.fetch(ARASAAC_PICTOGRAM_URL.format(id=pictogram_id)),
+                os.path.splitext(filename)[1] or ".png",
+            )
+        else:
+            raise ValueError(f"{source} symbols cannot be fetched again")
+        self.asset_store.link(filename, ref)
+        return ref
+
+    def repair_all(self, df, report):
+        """Repair the report's broken symbol rows; return ({row: asset}, failures)."""
+        rows = sorted(
+            {
+                row
+                for row, column, _ in report["missing"] + report["corrupt"]
+                if column == "symbol_filename"
+            }
+        )
+        repaired = {}
+        failures = []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(
+                    self.repair,
+                    df.loc[row, "symbol_filename"],
+                    df.loc[row, "symbol_source"],
+                    df.loc[row, "symbol_asset"],
+                ): row
+                for row in rows
+            }
+            for future in as_completed(futures):
+                row = futures[future]
+                try:
+                    repaired[row] = future.result()
+                except Exception as e:
+                    failures.append((row, str(e)))
+        return repaired, sorted(failures)
 
-# --- Configuration ---
-load_dotenv()
-FLATICON_API_KEY = str(os.getenv("FREEPIK_API_KEY"))
-ARASAAC_API_URL = "https://api.arasaac.org/api/pictograms/en/search/"
-FLATICON_API_URLS = {
-    "search": "https://api.freepik.com/v1/icons",
-    "download": "https://api.freepik.com/v1/icons/{id}/download",
-}
-SELECTED_SYMBOLS_DIR = "selected_symbols"
-MAX_GRID_COLUMNS = 4
+
+def integrity_summary(report):
+    summary = (
+        f"Checked {report['checked']} references ({report['files']} files): "
+        f"{len(report['missing'])} missing, {len(report['corrupt'])} corrupt"
+    )
+    if "orphaned" in report:
+        summary += f", {len(report['orphaned'])} not used by this deck"
+    return summary
+
+
+# ---
+# Deck Progress
+# ---
+class DeckProgress:
+    """Which rows of a deck have a symbol, kept current as picks are made.
+
+    filled and low_confidence are boolean arrays over the deck's rows. A row
+    is low-confidence when it was picked automatically and not reviewed yet,
+    or, for decks without review flags, when its match score is below
+    threshold. source_counts tallies the filled rows per symbol source.
+    """
+
+    def __init__(self, df, threshold=AUTOPICK_THRESHOLD):
+        """df must have the symbol columns, see ensure_symbol_columns()."""
+        self.threshold = threshold
+        filenames = df["symbol_filename"]
+        self.filled = filenames.notna().to_numpy(dtype=bool, copy=True)
+        reviewed = df["symbol_reviewed"]
+        scores = pd.to_numeric(df["symbol_score"], errors="coerce")
+        low = reviewed.isin([False, "False"]) | (reviewed.isna() & (scores < threshold))
+        self.low_confidence = self.filled & low.to_numpy(dtype=bool, copy=True)
+        self.sources = df["symbol_source"].to_numpy(dtype=object, copy=True)
+        self.source_counts = Counter(self.sources[self.filled])
+
+    def __len__(self):
+        return len(self.filled)
+
+    @property
+    def filled_count(self):
+        return int(self.filled.sum())
+
+    @property
+    def low_confidence_count(self):
+        return int(self.low_confidence.sum())
+
+    def update(self, row, df):
+        """Re-read one row of df after its symbol columns changed."""
+        if self.filled[row]:
+            self.source_counts[self.sources[row]] -= 1
+        self.filled[row] = pd.notna(df.loc[row, "symbol_filename"])
+        self.sources[row] = df.loc[row, "symbol_source"]
+        reviewed = df.loc[row, "symbol_reviewed"]
+        score = pd.to_numeric(df.loc[row, "symbol_score"], errors="coerce")
+        if pd.isna(reviewed):
+            low = pd.notna(score) and score < self.threshold
+        else:
+            low = reviewed in (False, "False")
+        self.low_confidence[row] = self.filled[row] and low
+        if self.filled[row]:
+            self.source_counts[self.sources[row]] += 1
+
+    @staticmethod
+    def next_set(flags, after):
+        """Return the first row past after whose flag is set, wrapping around."""
+        if not len(flags):
+            return None
+        order = np.concatenate((flags[after + 1 :], flags[: after + 1]))
+        position = int(np.argmax(order))
+        if not order[position]:
+            return None
+        return (after + 1 + position) % len(flags)
+
+    def next_unfilled(self, after=-1):
+        return self.next_set(~self.filled, after)
+
+    def next_low_confidence(self, after=-1):
+        return self.next_set(self.low_confidence, after)
+
+    def summary(self):
+        counts = ", ".join(
+            f"{source} {count}"
+            for source, count in self.source_counts.most_common()
+            if count and pd.notna(source)
+        )
+        text = f"{self.filled_count} / {len(self)} filled"
+        if counts:
+            text += f" ({counts})"
+        if self.low_confidence.any():
+            text += f" · {self.low_confidence_count} to review"
+        return text
+
+
+# ---
+# Sentence Mode
+# ---
+# A sampleUsage field packs "esperanto=english" pairs back to back, e.g.
+# "Ĉu vi estas en la oficejo hodiaŭ?=Are you in the office today?Mi ŝatas vin=I
+# like you." An English side ends where the next Esperanto sentence is glued
+# on: after closing punctuation with no space, or at a lower-to-upper case join.
+SENTENCE_JOIN = re.compile(r"(?<=[.!?])(?=\S)|(?<=[a-z])(?=[A-Z])")
+SENTENCE_TOKEN = re.compile(r"[A-Za-z0-9]+(?:'[A-Za-z]+)*")
+
+
+def sample_usage_pairs(raw_text):
+    """Split a sampleUsage field into (esperanto, english) sentence pairs."""
+    if pd.isna(raw_text):
+        return []
+    parts = str(raw_text).strip().strip('"').split("=")
+    pairs = []
+    esperanto = parts[0]
+    for i, part in enumerate(parts[1:], start=1):
+        boundary = SENTENCE_JOIN.search(part) if i < len(parts) - 1 else None
+        if boundary:
+            english, rest = part[: boundary.start()], part[boundary.start() :]
+        else:
+            english, rest = part, ""
+        if esperanto.strip() and english.strip():
+            pairs.append((esperanto.strip(), english.strip()))
+        esperanto = rest
+    return pairs
+
+
+def sentence_tokens(english):
+    return SENTENCE_TOKEN.findall(english)
+
+
+def sentence_strip_filename(word, row_index):
+    return f"{sanitized_filename_word(word, row_index)}_sentence_{row_index + 1}.png"
+
+
+def compose_pictogram_strip(images, size=SENTENCE_ICON_SIZE, padding=None):
+    """Lay images out left to right on one white strip and return it as PNG bytes."""
+    padding = int(PADDING_NORMAL * UI_SCALE) if padding is None else padding
+    width = len(images) * (size + padding) + padding
+    strip = Image.new("RGBA", (width, size + 2 * padding), (255, 255, 255, 255))
+    for i, image in enumerate(images):
+        tile = image.convert("RGBA")
+        tile.thumbnail((size, size), Image.Resampling.LANCZOS)
+        x = padding + i * (size + padding) + (size - tile.width) // 2
+        y = padding + (size - tile.height) // 2
+        strip.alpha_composite(tile, (x, y))
+    buffer = BytesIO()
+    strip.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+# ---
+# Batch Auto-Pick
+# ---
+class RateLimiter:
+    """Spaces calls out so that at most rate of them start per second, across threads."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        time.sleep(max(0.0, slot - now))
+
+
+class AutoPicker:
+    """Picks the best-scoring symbol for every unfilled row of a deck, headless.
+
+    Rows whose best candidate scores at least threshold get that symbol saved
+    under the GUI's filename scheme with symbol_reviewed False; the others
+    only get their best score recorded so the GUI can walk them by hand.
+    Every processed row is journaled, so an interrupted run resumes where it
+    stopped.
+    """
+
+    def __init__(
+        self,
+        sources=AUTOPICK_SOURCES,
+        threshold=AUTOPICK_THRESHOLD,
+        rate_limits=AUTOPICK_RATE_LIMITS,
+        offline=OFFLINE_MODE,
+    ):
+        self.sources = [
+            source
+            for source in sources
+            if not (offline and source not in ("Mulberry", "OpenMoji"))
+        ]
+        self.threshold = threshold
+        self.asset_store = AssetStore()
+        self.limiters = {
+            source: RateLimiter(rate_limits.get(source)) for source in self.sources
+        }
+        self.indexes = {}
+        if "Mulberry" in self.sources:
+            self.indexes["Mulberry"] = SymbolIndex.load(
+                "mulberry", MULBERRY_INFO_CSV, mulberry_catalog_entries
+            )
+        if "OpenMoji" in self.sources:
+            self.indexes["OpenMoji"] = SymbolIndex.load(
+                "openmoji", OPENMOJI_METADATA_CSV, openmoji_catalog_entries
+            )
+        self.http_client = None
+        if "ARASAAC" in self.sources:
+            self.http_client = HttpClient(cache=HttpCache(), offline=offline)
+
+    def best_candidate(self, query, grammar=None):
+        """Return (score, source, symbol) for the top result across sources, or None."""
+        best = None
+        for source in self.sources:
+            try:
+                symbol = self.top_symbol(source, query, grammar)
+            except Exception as e:
+                print(f"Error searching {source} for '{query}': {e}")
+                continue
+            if symbol is not None and (best is None or symbol["score"] > best[0]):
+                best = (symbol["score"], source, symbol)
+        return best
+
+    def top_symbol(self, source, query, grammar=None):
+        """Return source's best-ranked symbol for query, or None."""
+        if source in self.indexes:
+            return next(self.indexes[source].iter_ranked(query, 1, grammar), None)
+        self.limiters[source].wait()
+        try:
+            results = json.loads(self.http_client.fetch(f"{ARASAAC_API_URL}{query}"))
+        except requests.HTTPError as e:
+            # ARASAAC answers a search without matches with 404.
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+        if not results:
+            return None
+        item = results[0]
+        name = item.get("keywords", [{}])[0].get("keyword", "N/A")
+        return {
+            "name": name,
+            "url": ARASAAC_PICTOGRAM_URL.format(id=item["_id"]),
+            "score": match_score(query, name),
+        }
+
+    def pick_row(self, row_index, raw_text, tags=None):
+        """Choose and save a symbol for one row and return its word-symbol column values."""
+        word = split_english_text(raw_text)[0]
+        values = {col: pd.NA for col in WORD_SYMBOL_COLUMNS}
+        values["symbol_score"] = 0
+        values["symbol_reviewed"] = False
+        if word in ("(No Word)", "(Empty)"):
+            return values
+        best = self.best_candidate(normalize_query(word), vocab_grammar(tags))
+        if best is None:
+            return values
+        score, source, symbol = best
+        values["symbol_score"] = score
+        if score < self.threshold:
+            return values
+        filename = symbol_filename(word, row_index, symbol, source)
+        if "path" in symbol:
+            asset = self.asset_store.put_file(symbol["path"])
+        else:
+            self.limiters[source].wait()
+            asset = self.asset_store.put_bytes(
+                self.http_client.fetch(symbol["url"]),
+                os.path.splitext(filename)[1] or ".png",
+            )
+        self.asset_store.link(filename, asset)
+        values["symbol_filename"] = filename
+        values["symbol_asset"] = asset
+        values["symbol_name"] = symbol["name"]
+        values["symbol_source"] = source
+        return values
+
+    def run(self, df, journal, workers=AUTOPICK_WORKERS):
+        """Pick symbols for df's unfilled rows, journaling each as it completes.
+
+        Rows scored on an earlier run are skipped unless their score now meets
+        threshold, so a rerun with a lower threshold picks them.
+        """
+        ensure_symbol_columns(df)
+        os.makedirs(SELECTED_SYMBOLS_DIR, exist_ok=True)
+        scores = pd.to_numeric(df["symbol_score"], errors="coerce")
+        todo = df.index[
+            df["symbol_filename"].isna() & (scores.isna() | (scores >= self.threshold))
+        ].tolist()
+        print(f"Auto-picking {len(todo)} of {len(df)} entries with {workers} workers")
+        picked = processed = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            tags = df["tags"] if "tags" in df.columns else pd.Series(pd.NA, df.index)
+            futures = {
+                executor.submit(
+                    self.pick_row, row, df.loc[row, "english"], tags.loc[row]
+                ): row
+                for row in todo
+            }
+            try:
+                for future in as_completed(futures):
+                    row = futures[future]
+                    try:
+                        values = future.result()
+                    except Exception as e:
+                        print(f"Error auto-picking entry {row + 1}: {e}")
+                        continue
+                    for col, value in values.items():
+                        df.loc[row, col] = value
+                    journal.append(row, df)
+                    processed += 1
+                    picked += pd.notna(values["symbol_filename"])
+                    if processed % 500 == 0:
+                        print(f"  {processed}/{len(todo)} processed, {picked} picked")
+            finally:
+                for future in futures:
+                    future.cancel()
+        print(
+            f"Processed {processed} entries: {picked} picked, "
+            f"{processed - picked} left for review"
+        )
+        return picked
+
+
+# ---
+# Benchmarks
+# ---
+class StubArasaacClient:
+    """Answers ARASAAC searches and downloads locally so benchmarks stay offline."""
+
+    def __init__(self, image_data, results=RESULT_PAGE_SIZE):
+        self.image_data = image_data
+        self.results = results
+
+    def fetch(self, url, params=None, headers=None):
+        if not url.startswith(ARASAAC_API_URL):
+            return self.image_data
+        query = url[len(ARASAAC_API_URL) :]
+        return json.dumps(
+            [
+                {"_id": i, "keywords": [{"keyword": f"{query} {i}"}]}
+                for i in range(self.results)
+            ]
+        ).encode()
+
+
+def spread(items, count):
+    """Return up to count items taken at even intervals through items."""
+    return list(items[:: max(1, len(items) // count)])[:count]
+
+
+def measure(func, cases):
+    """Time func over every argument tuple in cases, then trace one call's memory."""
+    func(*cases[0])
+    samples = []
+    for args in cases:
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func(*cases[0])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "n": len(samples),
+        "p50_ms": round(percentile(samples, 0.5) * 1000, 3),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def benchmark_hot_paths(samples=200):
+    """Time the word-change hot paths on the bundled data, without a display or network."""
+    deck_df = read_deck(resolve_vocab_path(), columns=DECK_CORE_COLUMNS)
+    raw_texts = spread(deck_df["english"].tolist(), samples)
+    queries = [
+        word
+        for word in (split_english_text(text)[0] for text in raw_texts)
+        if word not in ("(No Word)", "(Empty)")
+    ]
+    page = SimpleNamespace(
+        mulberry_index=SymbolIndex.load(
+            "mulberry", MULBERRY_INFO_CSV, mulberry_catalog_entries
+        ),
+        openmoji_index=SymbolIndex.load(
+            "openmoji", OPENMOJI_METADATA_CSV, openmoji_catalog_entries
+        ),
+        search_memo=SearchMemo(capacity=0),  # time real searches, not memo hits
+    )
+    svg_paths, png_paths = (
+        spread([e["path"] for e in index.entries if os.path.exists(e["path"])], samples)
+        for index in (page.mulberry_index, page.openmoji_index)
+    )
+    page.http_client = StubArasaacClient(render_thumbnail(png_paths[0], 72))
+    page.iter_arasaac = lambda query: SymbolPickerPage.iter_arasaac(page, query)
+    icon_size = ICON_SIZE_MAP["Medium"]
+
+    def first_batch(search_func, query):
+        return list(islice(search_func(page, query), MAX_GRID_COLUMNS))
+
+    def arasaac_search(query):
+        for symbol in first_batch(SymbolPickerPage.search_arasaac, query):
+            download_symbol_image(page.http_client, symbol["url"])
+
+    memo_page = SimpleNamespace(
+        mulberry_index=page.mulberry_index, search_memo=SearchMemo()
+    )
+    for query in queries:
+        list(
+            islice(SymbolPickerPage.search_mulberry(memo_page, query), MAX_GRID_COLUMNS)
+        )
+
+    results = {
+        "search_mulberry": measure(
+            first_batch,
+            [(SymbolPickerPage.search_mulberry, q) for q in queries],
+        ),
+        "search_openmoji": measure(
+            first_batch,
+            [(SymbolPickerPage.search_openmoji, q) for q in queries],
+        ),
+        "search_arasaac_stubbed": measure(arasaac_search, [(q,) for q in queries]),
+        "search_mulberry_memoized": measure(
+            lambda q: list(
+                islice(SymbolPickerPage.search_mulberry(memo_page, q), MAX_GRID_COLUMNS)
+            ),
+            [(q,) for q in queries],
+        ),
+        "render_svg_thumbnail": measure(
+            render_thumbnail, [(path, icon_size) for path in svg_paths]
+        ),
+        "render_png_thumbnail": measure(
+            render_thumbnail, [(path, icon_size) for path in png_paths]
+        ),
+        "split_english_text": measure(
+            split_english_text, [(text,) for text in raw_texts]
+        ),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        page.output_filename = os.path.join(directory, "deck.csv")
+        page.output_df = ensure_symbol_columns(materialize_deck(deck_df))
+        page.journal = DeckJournal(page.output_filename)
+        page.current_index = 0
+        page.current_search_id = 0
+
+        def save_pick(index):
+            page.output_df.loc[index, "symbol_name"] = "benchmark"
+            page.journal.append(index, page.output_df)
+
+        with redirect_stdout(None):
+            results["journal_append"] = measure(
+                save_pick, [(i,) for i in spread(range(len(deck_df)), samples)]
+            )
+            results["save_to_current_file"] = measure(
+                SymbolPickerPage.save_to_current_file, [(page,)] * 10
+            )
+    return results
+
+
+def print_benchmarks(results, baseline=None):
+    """Print a results table, comparing p50/p95 against baseline when given."""
+    print(f"{'benchmark':<24}{'n':>6}{'p50 ms':>11}{'p95 ms':>11}{'peak KiB':>11}")
+    regressions = []
+    for name, result in results.items():
+        line = (
+            f"{name:<24}{result['n']:>6}{result['p50_ms']:>11.3f}"
+            f"{result['p95_ms']:>11.3f}{result['peak_kib']:>11.1f}"
+        )
+        previous = (baseline or {}).get(name)
+        if previous and previous["p50_ms"]:
+            ratio = result["p50_ms"] / previous["p50_ms"]
+            line += f"   x{ratio:.2f} vs baseline"
+            slower_ms = result["p50_ms"] - previous["p50_ms"]
+            if (
+                ratio > BENCHMARK_REGRESSION_RATIO
+                and slower_ms > BENCHMARK_NOISE_FLOOR_MS
+            ):
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+# ---
+# Startup
+# ---
+class StartupTimer:
+    """Records how long each cold-start phase takes and reports the totals."""
+
+    def __init__(self, start=STARTUP_CLOCK_START):
+        self.start = start
+        self.last = start
+        self.phases = []
+        self.lock = threading.Lock()
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        with self.lock:
+            self.phases.append((phase, now - self.last))
+            self.last = now
+
+    def report(self, report_path=STARTUP_REPORT_PATH):
+        """Print the phase timings and append them to report_path as a JSON line."""
+        total = self.last - self.start
+        print("Startup timing:")
+        for phase, seconds in self.phases:
+            print(f"  {phase:<20} {seconds * 1000:8.1f} ms")
+        print(f"  {'total':<20} {total * 1000:8.1f} ms")
+        if report_path:
+            record = {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "phases_ms": {phase: round(s * 1000, 1) for phase, s in self.phases},
+                "total_ms": round(total * 1000, 1),
+            }
+            try:
+                with open(report_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record) + "\n")
+            except OSError as e:
+                print(f"Could not write startup report: {e}")
 
 
 class SymbolPickerApp:
@@ -71,18 +2396,94 @@ class SymbolPickerApp:
         self.container.grid_columnconfigure(0, weight=1)
         self.container.grid_rowconfigure(0, weight=1)
 
+        self.start_page = StartPage(self.container, self)
+        self.symbol_picker_page = None
+        self.show_start_page()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        self.startup_timer = StartupTimer()
+        self.startup_queue = Queue()
+        self.root.after(0, lambda: self.startup_timer.mark("start page shown"))
+        threading.Thread(target=self.load_startup_resources, daemon=True).start()
+        self.poll_startup_queue()
+
+    def load_startup_resources(self):
+        """Import heavy modules and load the vocab and symbol catalogs (worker thread)."""
+        steps = [
+            ("libraries", "Loading libraries...", import_heavy_modules),
+            ("vocab", "Loading vocabulary...", self.load_base_vocab),
+            ("mulberry index", "Loading Mulberry symbols...", self.load_mulberry),
+            ("openmoji index", "Loading OpenMoji symbols...", self.load_openmoji),
+        ]
+        for step_number, (phase, message, load_step) in enumerate(steps):
+            self.startup_queue.put(("PROGRESS", message, step_number / len(steps)))
+            try:
+                load_step()
+            except FileNotFoundError as e:
+                self.startup_queue.put(("MISSING", phase, e.filename))
+                return
+            except Exception as e:
+                self.startup_queue.put(("ERROR", phase, e))
+                return
+            self.startup_timer.mark(phase)
+        self.startup_queue.put(("READY", None, 1.0))
+
+    def load_base_vocab(self):
+        self.base_vocab_df = read_deck(resolve_vocab_path(), columns=DECK_CORE_COLUMNS)
+
+    def load_mulberry(self):
+        self.mulberry_index = SymbolIndex.load(
+            "mulberry", MULBERRY_INFO_CSV, mulberry_catalog_entries
+        )
+
+    def load_openmoji(self):
+        self.openmoji_index = SymbolIndex.load(
+            "openmoji", OPENMOJI_METADATA_CSV, openmoji_catalog_entries
+        )
+
+    def poll_startup_queue(self):
         try:
-            self.base_vocab_df = pd.read_csv(
-                "Gabe_Esperanto cards_filtered_cleaned_no_starters_no_jn_rerank.csv"
-            )
-        except FileNotFoundError as e:
-            messagebox.showerror("Error", f"Could not find required file: {e.filename}")
+            item_type, detail, value = self.startup_queue.get_nowait()
+        except Empty:
+            self.root.after(50, self.poll_startup_queue)
+            return
+        if item_type == "PROGRESS":
+            self.start_page.set_progress(detail, value)
+        elif item_type == "READY":
+            self.start_page.set_ready()
+            self.startup_timer.mark("ready")
+            self.startup_timer.report()
+            return
+        elif item_type == "MISSING" and detail == "vocab":
+            messagebox.showerror("Error", f"Could not find required file: {value}")
             self.root.destroy()
             return
+        elif item_type == "MISSING":
+            self.start_page.set_progress(
+                f"Could not find a required local symbol file: {value}", 0
+            )
+            return
+        else:
+            self.start_page.set_progress(
+                f"Startup failed while loading {detail}: {value}", 0
+            )
+            return
+        self.root.after(0, self.poll_startup_queue)
 
-        self.start_page = StartPage(self.container, self)
-        self.symbol_picker_page = None
-        self.show_start_page()
+    def on_close(self):
+        """Fold any journaled picks into the open deck before exiting."""
+        page = self.symbol_picker_page
+        if page is not None and page.journal.pending:
+            try:
+                page.journal.compact(page.output_df)
+            except Exception as e:
+                print(f"Could not compact deck journal on exit: {e}")
+        if telemetry.enabled and TELEMETRY_EXPORT_PATH:
+            try:
+                telemetry.export(TELEMETRY_EXPORT_PATH)
+            except OSError as e:
+                print(f"Could not export telemetry: {e}")
+        self.root.destroy()
 
     def go_home_from_picker(self):
         """Handle the logic for returning to the home screen from the picker."""
@@ -93,6 +2494,8 @@ class SymbolPickerApp:
 
         if is_autosave_on:
             filename = os.path.basename(self.symbol_picker_page.output_filename)
+            if not self.symbol_picker_page.compact_journal():
+                return
             self.show_start_page()
             messagebox.showinfo(
                 "Autosaved", f"Progress automatically saved to\n{filename}"
@@ -167,19 +2570,48 @@ class StartPage:
         button_frame.grid(row=1, column=0, pady=int(PADDING_LARGE * UI_SCALE))
         button_font = ctk.CTkFont(family="Arial", size=int(FONT_SIZE_LARGE * UI_SCALE))
         button_ipadding = int(BUTTON_IPAD * UI_SCALE)
-        ctk.CTkButton(
+        self.new_deck_button = ctk.CTkButton(
             button_frame,
             text="Start New Symbol Deck",
             font=button_font,
             command=self.start_new,
-        ).pack(pady=int(PADDING_NORMAL * UI_SCALE), ipady=button_ipadding)
-        ctk.CTkButton(
+            state="disabled",
+        )
+        self.new_deck_button.pack(
+            pady=int(PADDING_NORMAL * UI_SCALE), ipady=button_ipadding
+        )
+        self.load_deck_button = ctk.CTkButton(
             button_frame,
             text="Load Existing Deck",
             font=button_font,
             command=self.load_existing,
             fg_color="gray50",
-        ).pack(pady=int(PADDING_NORMAL * UI_SCALE), ipady=button_ipadding)
+            state="disabled",
+        )
+        self.load_deck_button.pack(
+            pady=int(PADDING_NORMAL * UI_SCALE), ipady=button_ipadding
+        )
+        self.progress_bar = ctk.CTkProgressBar(
+            self.main_frame, width=int(ENTRY_WIDTH * UI_SCALE)
+        )
+        self.progress_bar.set(0)
+        self.progress_bar.grid(row=2, column=0, pady=int(PADDING_SMALL * UI_SCALE))
+        self.status_label = ctk.CTkLabel(
+            self.main_frame,
+            text="Starting...",
+            font=ctk.CTkFont(family="Arial", size=int(FONT_SIZE_NORMAL * UI_SCALE)),
+        )
+        self.status_label.grid(row=3, column=0, pady=int(PADDING_SMALL * UI_SCALE))
+
+    def set_progress(self, message, fraction):
+        self.status_label.configure(text=message)
+        self.progress_bar.set(fraction)
+
+    def set_ready(self):
+        self.progress_bar.grid_remove()
+        self.status_label.grid_remove()
+        self.new_deck_button.configure(state="normal")
+        self.load_deck_button.configure(state="normal")
 
     def start_new(self):
         dialog = ctk.CTkInputDialog(
@@ -195,41 +2627,458 @@ class StartPage:
                 f'"{output_filename}" already exists. Do you want to overwrite it?',
             ):
                 return
-        new_df = self.controller.base_vocab_df.copy()
-        for col in ["symbol_filename", "symbol_name", "symbol_source"]:
-            if col not in new_df.columns:
-                new_df[col] = pd.NA
+        new_df = ensure_symbol_columns(self.controller.base_vocab_df.copy())
+        try:
+            create_deck(new_df, output_filename)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not create deck: {e}")
+            return
         self.controller.launch_symbol_picker(output_filename, new_df)
 
     def load_existing(self):
         filename = filedialog.askopenfilename(
             title="Select a Symbol Deck",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            filetypes=[
+                ("Deck files", "*.csv *.parquet *.feather"),
+                *DECK_FILETYPES,
+                ("All files", "*.*"),
+            ],
         )
         if not filename:
             return
-        try:
-            loaded_df = pd.read_csv(filename)
-            start_index = 0
-            completed_count = 0
-            if "symbol_filename" in loaded_df.columns:
-                completed_rows = loaded_df["symbol_filename"].notna()
-                completed_count = completed_rows.sum()
-                first_incomplete = (
-                    completed_rows.idxmin()
-                    if not completed_rows.all()
-                    else len(loaded_df)
-                )
-                start_index = first_incomplete
-            total_entries = len(loaded_df)
-            message = f"Loaded {total_entries} entries. {completed_count} items have symbols.\n\nStarting at entry {start_index + 1}."
-            if completed_count > 0 and start_index == len(loaded_df):
-                message = f"Deck is complete with {completed_count} symbols! Loading last entry."
-                start_index = len(loaded_df) - 1
-            messagebox.showinfo("Deck Loaded", message)
-            self.controller.launch_symbol_picker(filename, loaded_df, start_index)
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not load file: {e}")
+        try:
+            loaded_df = read_deck(filename, columns=DECK_CORE_COLUMNS)
+            DeckJournal(filename).replay(loaded_df)
+            progress = DeckProgress(ensure_symbol_columns(loaded_df))
+            completed_count = progress.filled_count
+            start_index = progress.next_unfilled()
+            if start_index is None:
+                start_index = len(loaded_df)
+            total_entries = len(loaded_df)
+            message = f"Loaded {total_entries} entries. {completed_count} items have symbols.\n\nStarting at entry {start_index + 1}."
+            if completed_count > 0 and start_index == len(loaded_df):
+                message = f"Deck is complete with {completed_count} symbols! Loading last entry."
+                start_index = len(loaded_df) - 1
+            messagebox.showinfo("Deck Loaded", message)
+            self.controller.launch_symbol_picker(filename, loaded_df, start_index)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not load file: {e}")
+
+
+# ---
+# Telemetry Panel
+# ---
+class TelemetryPanel(ctk.CTkToplevel):
+    """Debug window showing the rolling per-phase latency histogram and memo hit rates."""
+
+    REFRESH_MS = 1000
+
+    def __init__(self, master, search_memo=None):
+        super().__init__(master)
+        self.search_memo = search_memo
+        self.title("Telemetry")
+        self.geometry(f"{int(520 * UI_SCALE)}x{int(360 * UI_SCALE)}")
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        self.textbox = ctk.CTkTextbox(
+            self,
+            font=ctk.CTkFont(family="Courier", size=int(FONT_SIZE_NORMAL * UI_SCALE)),
+        )
+        self.textbox.grid(
+            row=0, column=0, sticky="nsew", padx=int(PADDING_SMALL * UI_SCALE)
+        )
+        button_frame = ctk.CTkFrame(self, fg_color="transparent")
+        button_frame.grid(row=1, column=0, pady=int(PADDING_SMALL * UI_SCALE))
+        ctk.CTkButton(
+            button_frame,
+            text="Export JSON Lines...",
+            command=lambda: self.export(".jsonl", "JSON Lines"),
+        ).pack(side="left", padx=int(PADDING_SMALL * UI_SCALE))
+        ctk.CTkButton(
+            button_frame,
+            text="Export Chrome Trace...",
+            command=lambda: self.export(".json", "Chrome trace"),
+        ).pack(side="left", padx=int(PADDING_SMALL * UI_SCALE))
+        self.refresh()
+
+    def refresh(self):
+        if not self.winfo_exists():
+            return
+        lines = [f"{'phase':<22}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+        for phase, stats in telemetry.histogram().items():
+            lines.append(
+                f"{phase:<22}{stats['n']:>6}{stats['p50_ms']:>10.1f}"
+                f"{stats['p95_ms']:>10.1f}{stats['max_ms']:>10.1f}"
+            )
+        if self.search_memo is not None:
+            lines.append("")
+            lines.append(f"{'search memo':<22}{'hits':>6}{'misses':>10}{'hit %':>10}")
+            for source, (hits, misses) in self.search_memo.stats().items():
+                lines.append(
+                    f"{source:<22}{hits:>6}{misses:>10}"
+                    f"{100 * hits / (hits + misses):>10.1f}"
+                )
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("1.0", "\n".join(lines))
+        self.textbox.configure(state="disabled")
+        self.after(self.REFRESH_MS, self.refresh)
+
+    def export(self, extension, description):
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=extension,
+            filetypes=[(description, f"*{extension}")],
+            initialfile=f"telemetry{extension}",
+        )
+        if not path:
+            return
+        try:
+            count = telemetry.export(path)
+            messagebox.showinfo(
+                "Exported", f"Wrote {count} spans to {path}", parent=self
+            )
+        except OSError as e:
+            messagebox.showerror(
+                "Export Failed", f"Could not export:\n{e}", parent=self
+            )
+
+
+# ---
+# Sentence Panel
+# ---
+class SentencePanel(ctk.CTkToplevel):
+    """Assemble an ordered pictogram strip for one sample sentence of an entry.
+
+    Every token is looked up concurrently through the page's shared token
+    cache. Clicking a token cycles through its candidates; right-clicking
+    leaves it out of the strip.
+    """
+
+    def __init__(self, page, row_index, pairs):
+        super().__init__(page.root)
+        self.page = page
+        self.row_index = row_index
+        self.pairs = pairs
+        self.title(f"Sentence Mode - entry {row_index + 1}")
+        self.pool = ThreadPoolExecutor(max_workers=SENTENCE_WORKERS)
+        self.updates = Queue()
+        self.generation = 0
+        self.cells = []
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        font = page.normal_font
+        self.sentence_dropdown = ctk.CTkComboBox(
+            self,
+            values=[english for _, english in pairs],
+            command=self.show_sentence,
+            width=int(ENTRY_WIDTH * 2 * UI_SCALE),
+            font=font,
+        )
+        self.sentence_dropdown.grid(
+            row=0, column=0, sticky="ew", padx=int(PADDING_NORMAL * UI_SCALE)
+        )
+        self.esperanto_label = ctk.CTkLabel(self, text="", font=page.italic_font)
+        self.esperanto_label.grid(row=1, column=0, pady=int(PADDING_SMALL * UI_SCALE))
+        self.strip_frame = ctk.CTkScrollableFrame(
+            self, orientation="horizontal", height=int(SENTENCE_ICON_SIZE * 1.6)
+        )
+        self.strip_frame.grid(
+            row=2, column=0, sticky="nsew", padx=int(PADDING_NORMAL * UI_SCALE)
+        )
+        ctk.CTkLabel(
+            self,
+            text="Click a pictogram for the next candidate; right-click to leave it out.",
+            font=font,
+        ).grid(row=3, column=0, pady=int(PADDING_SMALL * UI_SCALE))
+        ctk.CTkButton(self, text="Save Strip", command=self.save_strip, font=font).grid(
+            row=4, column=0, pady=int(PADDING_NORMAL * UI_SCALE)
+        )
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(2, weight=1)
+
+        self.sentence_dropdown.set(pairs[0][1])
+        self.show_sentence(pairs[0][1])
+        self.poll_updates()
+
+    def show_sentence(self, english):
+        esperanto = next(eo for eo, en in self.pairs if en == english)
+        self.esperanto_label.configure(text=esperanto)
+        self.generation += 1
+        for cell in self.cells:
+            cell["button"].destroy()
+        self.cells = []
+        for position, token in enumerate(sentence_tokens(english)):
+            button = ctk.CTkButton(
+                self.strip_frame,
+                text=f"{token}\n...",
+                compound="top",
+                fg_color="transparent",
+                text_color=("black", "white"),
+                font=self.page.normal_font,
+                command=lambda p=position: self.next_candidate(p),
+            )
+            button.bind("<Button-3>", lambda _, p=position: self.toggle_included(p))
+            button.grid(row=0, column=position, padx=int(PADDING_SMALL * UI_SCALE))
+            self.cells.append(
+                {
+                    "token": token,
+                    "button": button,
+                    "candidates": None,
+                    "choice": 0,
+                    "image": None,
+                    "included": True,
+                }
+            )
+            self.pool.submit(self.load_cell, position, token, 0, self.generation)
+
+    def load_cell(self, position, token, choice, generation):
+        """Look up token and load its choice-th candidate image (worker thread)."""
+        try:
+            candidates = self.page.token_candidates(token)
+            image = None
+            if candidates:
+                source, symbol = candidates[choice % len(candidates)]
+                with telemetry.span("rasterize", query=token):
+                    image = self.page.candidate_image(source, symbol)
+            self.updates.put((generation, position, candidates, choice, image, None))
+        except Exception as e:
+            self.updates.put((generation, position, None, choice, None, e))
+
+    def poll_updates(self):
+        if not self.winfo_exists():
+            return
+        while True:
+            try:
+                generation, position, candidates, choice, image, error = (
+                    self.updates.get_nowait()
+                )
+            except Empty:
+                break
+            if generation != self.generation:
+                continue
+            cell = self.cells[position]
+            if error is not None:
+                print(f"Error looking up sentence token '{cell['token']}': {error}")
+                cell["button"].configure(text=f"{cell['token']}\n(error)")
+                continue
+            cell["candidates"] = candidates
+            cell["choice"] = choice
+            cell["image"] = image
+            self.refresh_cell(cell)
+        self.after(50, self.poll_updates)
+
+    def refresh_cell(self, cell):
+        if cell["image"] is None:
+            cell["button"].configure(image=None, text=f"{cell['token']}\n(none)")
+            return
+        source, symbol = cell["candidates"][cell["choice"] % len(cell["candidates"])]
+        label = cell["token"] if cell["included"] else f"({cell['token']})"
+        cell["button"].configure(
+            image=ctk.CTkImage(
+                light_image=cell["image"],
+                size=(SENTENCE_ICON_SIZE, SENTENCE_ICON_SIZE),
+            ),
+            text=f"{label}\n{source}: {symbol['name'][:20]}",
+            text_color=("black", "white") if cell["included"] else "gray50",
+        )
+
+    def next_candidate(self, position):
+        cell = self.cells[position]
+        if not cell["candidates"]:
+            return
+        self.pool.submit(
+            self.load_cell, position, cell["token"], cell["choice"] + 1, self.generation
+        )
+
+    def toggle_included(self, position):
+        cell = self.cells[position]
+        cell["included"] = not cell["included"]
+        self.refresh_cell(cell)
+
+    def save_strip(self):
+        images = [
+            cell["image"]
+            for cell in self.cells
+            if cell["included"] and cell["image"] is not None
+        ]
+        if not images:
+            messagebox.showerror("Sentence Mode", "No pictograms to save.", parent=self)
+            return
+        try:
+            filename = self.page.save_sentence_strip(self.row_index, images)
+            messagebox.showinfo("Saved", f"Saved strip as {filename}", parent=self)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not save strip: {e}", parent=self)
+
+    def close(self):
+        self.generation += 1
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+
+# ---
+# Symbol Grid
+# ---
+class SymbolGrid:
+    """Per-source sections of recycled symbol cells inside a scrollable frame.
+
+    Cells are created once and kept in a pool; showing a new set of results only
+    swaps each cell's image and text, and moving the selection only touches the
+    previously and newly highlighted cells.
+    """
+
+    def __init__(self, frame, header_font, cell_font, padding, on_select):
+        self.frame = frame
+        self.header_font = header_font
+        self.cell_font = cell_font
+        self.padding = padding
+        self.on_select = on_select
+        self.headers = {}
+        self.cells = []
+        self.cell_images = []
+        self.cell_symbols = []
+        self.free_cells = []
+        self.sections = {}
+        self.order = []
+        self.placements = {}
+        self.selected = -1
+        self.highlighted_cell = None
+
+    def clear(self):
+        """Take every cell and header off the grid and return the cells to the pool."""
+        for cell in self.order:
+            self.cells[cell].grid_remove()
+            self.cell_symbols[cell] = None
+            self.free_cells.append(cell)
+        for header in self.headers.values():
+            header.grid_remove()
+        if self.highlighted_cell is not None:
+            self.cells[self.highlighted_cell].configure(border_width=0)
+        self.sections = {}
+        self.order = []
+        self.placements = {}
+        self.selected = -1
+        self.highlighted_cell = None
+
+    def add_section(self, source):
+        if source in self.sections:
+            return
+        self.sections[source] = []
+        if source not in self.headers:
+            self.headers[source] = ctk.CTkLabel(
+                self.frame, text=f"--- {source} ---", font=self.header_font
+            )
+        self.layout()
+
+    def add_symbol(self, source, symbol, image, size):
+        cell = self.acquire_cell(image, size)
+        self.cells[cell].configure(text=symbol["name"][:30])
+        self.cell_symbols[cell] = (symbol, source)
+        self.add_section(source)
+        self.sections[source].append(cell)
+        self.layout()
+        if self.selected == -1:
+            self.select(0)
+
+    def acquire_cell(self, image, size):
+        if self.free_cells:
+            cell = self.free_cells.pop()
+            self.cell_images[cell].configure(light_image=image, size=(size, size))
+            return cell
+        cell = len(self.cells)
+        ctk_image = ctk.CTkImage(light_image=image, size=(size, size))
+        button = ctk.CTkButton(
+            self.frame,
+            image=ctk_image,
+            text="",
+            compound="top",
+            command=lambda c=cell: self.on_select(*self.cell_symbols[c]),
+            fg_color="transparent",
+            border_width=0,
+            text_color=("black", "white"),
+            font=self.cell_font,
+        )
+        self.cells.append(button)
+        self.cell_images.append(ctk_image)
+        self.cell_symbols.append(None)
+        return cell
+
+    def layout(self):
+        """Grid headers and cells in SYMBOL_SOURCES order, moving only cells that shift."""
+        selected_cell = self.order[self.selected] if self.selected != -1 else None
+        row = 0
+        self.order = []
+        for source in SYMBOL_SOURCES:
+            if source not in self.sections:
+                continue
+            self.headers[source].grid(
+                row=row,
+                column=0,
+                columnspan=MAX_GRID_COLUMNS,
+                pady=int(PADDING_NORMAL * UI_SCALE),
+                sticky="w",
+            )
+            row += 1
+            cells = self.sections[source]
+            for i, cell in enumerate(cells):
+                placement = (
+                    row + i // MAX_GRID_COLUMNS,
+                    i % MAX_GRID_COLUMNS,
+                    self.padding,
+                )
+                if self.placements.get(cell) != placement:
+                    self.cells[cell].grid(
+                        row=placement[0],
+                        column=placement[1],
+                        padx=self.padding,
+                        pady=self.padding,
+                    )
+                    self.placements[cell] = placement
+            row += -(-len(cells) // MAX_GRID_COLUMNS)
+            self.order.extend(cells)
+        if selected_cell is not None:
+            self.selected = self.order.index(selected_cell)
+
+    def set_padding(self, padding):
+        self.padding = padding
+        self.layout()
+
+    def resize(self, size):
+        for cell in self.order:
+            self.cell_images[cell].configure(size=(size, size))
+
+    def set_image(self, source, position, image, size):
+        cell = self.sections[source][position]
+        self.cell_images[cell].configure(light_image=image, size=(size, size))
+
+    def select(self, position):
+        """Highlight the cell at position, un-highlighting only the previous one."""
+        if not 0 <= position < len(self.order):
+            return
+        self.selected = position
+        cell = self.order[position]
+        if self.highlighted_cell is not None and self.highlighted_cell != cell:
+            self.cells[self.highlighted_cell].configure(border_width=0)
+        accent_color = ctk.ThemeManager.theme["CTkButton"]["fg_color"]
+        button = self.cells[cell]
+        button.configure(border_color=accent_color, border_width=2)
+        button.focus_set()
+        self.highlighted_cell = cell
+        self.frame.after(
+            50,
+            lambda: self.frame._parent_canvas.yview_moveto(
+                button.winfo_y() / self.frame.winfo_height()
+            ),
+        )
+
+    def move_selection(self, step):
+        if self.selected != -1:
+            self.select(self.selected + step)
+
+    def invoke_selected(self):
+        if self.selected != -1:
+            self.cells[self.order[self.selected]].invoke()
 
 
 # ---
@@ -242,44 +3091,114 @@ class SymbolPickerPage:
         self.controller = controller
         self.autosave_var = ctk.BooleanVar(value=True)  # Variable for checkbox state
 
-        base_size_map = {
-            "Extra Small": 64,
-            "Small": 96,
-            "Medium": 128,
-            "Large": 192,
-            "Extra Large": 256,
-        }
-        self.size_map = {k: int(v * UI_SCALE) for k, v in base_size_map.items()}
-        base_padding_map = {"Small": 5, "Medium": 10, "Large": 15}
-        self.padding_map = {k: int(v * UI_SCALE) for k, v in base_padding_map.items()}
-
-        try:
-            self.mulberry_df = pd.read_csv("symbol-info.csv")
-            self.openmoji_df = pd.read_csv(
-                os.path.join("openmoji-618x618-color", "metadata.csv")
-            )
-        except FileNotFoundError as e:
-            messagebox.showerror(
-                "Error", f"Could not find a required local symbol file: {e.filename}"
-            )
-            self.controller.show_start_page()
-            return
+        self.size_map = dict(ICON_SIZE_MAP)
+        self.padding_map = {k: int(v * UI_SCALE) for k, v in BASE_PADDING_MAP.items()}
 
+        self.mulberry_index = controller.mulberry_index
+        self.openmoji_index = controller.openmoji_index
+        self.thumbnail_cache = ThumbnailCache()
+        self.asset_store = AssetStore()
+        self.http_client = HttpClient(cache=HttpCache())
+        self.remote_engine = RemoteSearchEngine()
+        self.integrity_scan = DeckIntegrityScan(self.asset_store, self.http_client)
+        self.integrity_queue = Queue()
+        self.render_pool = ThreadPoolExecutor(max_workers=RENDER_WORKERS)
+        self.render_futures = []
+        self.rendered_icon_size = None
+        self.results_queue = Queue()
+        self.current_search_id = 0
+        self.search_memo = SearchMemo()
+        self.search_result_cache = BudgetLRU(
+            PREFETCH_CACHE_BUDGET, search_results_nbytes
+        )
+        self.prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self.prefetch_futures = {}
+        self.result_streams = {}
+        self.loading_sources = set()
+        self.current_query = None
+        self.current_grammar = None
+        self.telemetry_panel = None
+        self.sentence_panel = None
+        self.token_cache = OrderedDict()
+        self.token_cache_lock = threading.Lock()
+        self.token_search_pool = ThreadPoolExecutor(max_workers=RENDER_WORKERS)
         self.setup_gui()
+        self.process_queue()
 
     def reload(self, output_filename, dataframe, start_index=0):
         self.output_filename = output_filename
-        self.output_df = dataframe
+        self.output_df = ensure_symbol_columns(dataframe)
+        self.journal = DeckJournal(output_filename)
+        self.progress = DeckProgress(self.output_df)
         self.current_index = start_index
-        self.symbol_buttons = []
-        self.selected_index = -1
-        self.grid_row, self.grid_col = 0, 0
-        self.results_queue = Queue()
-        self.current_search_id = 0
+        self.symbol_grid.clear()
+        self.current_search_id += 1
         self.cached_results = {}
+        self.cancel_pending_renders()
         if not os.path.exists(SELECTED_SYMBOLS_DIR):
             os.makedirs(SELECTED_SYMBOLS_DIR)
         self.root.after(100, self.search_for_symbols)
+        self.update_progress_display()
+        self.start_integrity_scan()
+
+    def start_integrity_scan(self):
+        """Check the deck's symbol files in the background, offering repair if broken."""
+        deck_df = self.output_df[DECK_CORE_COLUMNS].copy()
+        threading.Thread(
+            target=self.run_integrity_scan,
+            args=(self.output_filename, deck_df),
+            daemon=True,
+        ).start()
+
+    def run_integrity_scan(self, output_filename, deck_df):
+        try:
+            report = self.integrity_scan.run(deck_df)
+        except Exception as e:
+            print(f"Error checking symbol files: {e}")
+            return
+        print(integrity_summary(report))
+        self.integrity_queue.put(("REPORT", output_filename, (deck_df, report)))
+
+    def run_integrity_repair(self, output_filename, deck_df, report):
+        repaired, failures = self.integrity_scan.repair_all(deck_df, report)
+        for row, error in failures:
+            print(f"Could not restore symbol for entry {row + 1}: {error}")
+        self.integrity_queue.put(("REPAIRED", output_filename, (deck_df, repaired)))
+
+    def poll_integrity_queue(self):
+        while True:
+            try:
+                item_type, output_filename, payload = self.integrity_queue.get_nowait()
+            except Empty:
+                break
+            if output_filename != self.output_filename:
+                continue
+            deck_df, result = payload
+            if item_type == "REPORT":
+                broken = len(result["missing"]) + len(result["corrupt"])
+                if broken and messagebox.askyesno(
+                    "Missing Symbols",
+                    f"{broken} symbol files of this deck are missing or unreadable."
+                    "\n\nRestore them from their sources now?",
+                ):
+                    threading.Thread(
+                        target=self.run_integrity_repair,
+                        args=(output_filename, deck_df, result),
+                        daemon=True,
+                    ).start()
+            elif item_type == "REPAIRED":
+                for row, asset in result.items():
+                    filename = self.output_df.loc[row, "symbol_filename"]
+                    if (
+                        pd.isna(filename)
+                        or filename != deck_df.loc[row, "symbol_filename"]
+                    ):
+                        continue
+                    self.output_df.loc[row, "symbol_asset"] = asset
+                    self.auto_save(row)
+                messagebox.showinfo(
+                    "Symbols Restored", f"Restored {len(result)} symbol files."
+                )
 
     def disable_root_key_bindings(self, event):
         self.root.unbind("<KeyPress>")
@@ -399,10 +3318,39 @@ class SymbolPickerPage:
         self.flaticon_button.pack(
             side="left", padx=int(PADDING_SMALL * UI_SCALE), ipady=button_ipadding
         )
+        self.more_button = ctk.CTkButton(
+            search_buttons_frame,
+            text="More Results",
+            command=self.load_more_results,
+            state="disabled",
+            font=self.normal_font,
+        )
+        self.more_button.pack(
+            side="left", padx=int(PADDING_SMALL * UI_SCALE), ipady=button_ipadding
+        )
+        self.sentence_button = ctk.CTkButton(
+            search_buttons_frame,
+            text="Sentence Mode",
+            command=self.open_sentence_panel,
+            fg_color="gray50",
+            font=self.normal_font,
+        )
+        self.sentence_button.pack(
+            side="left", padx=int(PADDING_SMALL * UI_SCALE), ipady=button_ipadding
+        )
         self.scrollable_frame = ctk.CTkScrollableFrame(
             self.main_frame, label_text="Symbols", label_font=self.normal_font
         )
         self.scrollable_frame.grid(row=2, column=0, sticky="nsew")
+        self.symbol_grid = SymbolGrid(
+            self.scrollable_frame,
+            self.header_font,
+            self.normal_font,
+            self.get_current_padding(),
+            self.select_symbol,
+        )
+        self.word_buttons = []
+        self.existing_symbol_image = None
         self.existing_symbol_frame = ctk.CTkFrame(self.main_frame)
         self.existing_symbol_frame.grid_columnconfigure(0, weight=1)
         self.existing_symbol_label = ctk.CTkLabel(self.existing_symbol_frame, text="")
@@ -417,6 +3365,13 @@ class SymbolPickerPage:
             command=self.refresh_symbol_grid,
             font=self.normal_font,
         ).pack(pady=int(PADDING_LARGE * UI_SCALE), ipady=button_ipadding)
+        self.keep_symbol_button = ctk.CTkButton(
+            self.existing_symbol_frame,
+            text="Keep Symbol",
+            command=self.keep_symbol,
+            fg_color="gray50",
+            font=self.normal_font,
+        )
         self.existing_symbol_frame.grid_remove()
         nav_frame = ctk.CTkFrame(self.main_frame)
         nav_frame.grid(
@@ -451,6 +3406,24 @@ class SymbolPickerPage:
         self.next_button.grid(
             row=0, column=2, padx=int(PADDING_SMALL * UI_SCALE), ipady=button_ipadding
         )
+        ctk.CTkButton(
+            nav_frame,
+            text="Next Unfilled (N)",
+            command=self.next_unfilled,
+            fg_color="gray50",
+            font=self.normal_font,
+        ).grid(
+            row=0, column=3, padx=int(PADDING_SMALL * UI_SCALE), ipady=button_ipadding
+        )
+        ctk.CTkButton(
+            nav_frame,
+            text="Next to Review (R)",
+            command=self.next_low_confidence,
+            fg_color="gray50",
+            font=self.normal_font,
+        ).grid(
+            row=0, column=4, padx=int(PADDING_SMALL * UI_SCALE), ipady=button_ipadding
+        )
 
         # --- Bottom Frame for Save Button and Autosave Checkbox ---
         bottom_frame = ctk.CTkFrame(self.main_frame)
@@ -467,6 +3440,17 @@ class SymbolPickerPage:
         )
         self.autosave_checkbox.grid(row=0, column=0, padx=10)
 
+        progress_frame = ctk.CTkFrame(bottom_frame, fg_color="transparent")
+        progress_frame.grid(row=0, column=1, sticky="ew", padx=10)
+        progress_frame.grid_columnconfigure(0, weight=1)
+        self.progress_bar = ctk.CTkProgressBar(progress_frame)
+        self.progress_bar.set(0)
+        self.progress_bar.grid(row=0, column=0, sticky="ew")
+        self.progress_label = ctk.CTkLabel(
+            progress_frame, text="", font=self.normal_font
+        )
+        self.progress_label.grid(row=1, column=0)
+
         self.save_button = ctk.CTkButton(
             bottom_frame,
             text="Save As...",
@@ -485,31 +3469,52 @@ class SymbolPickerPage:
         return self.padding_map.get(self.padding_dropdown.get(), 10)
 
     def on_size_select(self, choice):
-        self.redraw_grid_from_cache()
+        self.symbol_grid.resize(self.get_current_icon_size())
+        self.rerender_if_resized()
 
     def on_padding_select(self, choice):
-        self.redraw_grid_from_cache()
+        self.symbol_grid.set_padding(self.get_current_padding())
 
     def redraw_grid_from_cache(self):
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        self.grid_row, self.grid_col = 0, 0
-        self.symbol_buttons = []
-        self.selected_index = -1
-        for source in ["Mulberry", "OpenMoji", "ARASAAC", "Flaticon"]:
+        self.symbol_grid.clear()
+        for source in SYMBOL_SOURCES:
             if source in self.cached_results:
                 self.display_header(source)
-                for symbol, data, data_type in self.cached_results[source]:
-                    self.display_symbol(source, symbol, data, data_type)
+                for symbol, _, _, image in self.cached_results[source]:
+                    self.display_symbol(source, symbol, image)
+        self.rerender_if_resized()
+
+    def rerender_if_resized(self):
+        size = self.get_current_icon_size()
+        if size != self.rendered_icon_size:
+            self.rendered_icon_size = size
+            self.render_futures.append(
+                self.render_pool.submit(
+                    self.rerender_cached_symbols,
+                    dict(self.cached_results),
+                    size,
+                    self.current_search_id,
+                )
+            )
 
     def search_for_symbols(self):
-        self.update_word_display()
-        if "symbol_filename" in self.output_df.columns and pd.notna(
+        self.remote_engine.cancel_before(self.current_search_id + 1)
+        has_symbol = "symbol_filename" in self.output_df.columns and pd.notna(
             self.output_df.loc[self.current_index, "symbol_filename"]
-        ):
-            self.show_existing_symbol()
-        else:
-            self.refresh_symbol_grid()
+        )
+        # Only a grid refresh starts a search, so only then tag the span with one.
+        search_id = query = None
+        if not has_symbol:
+            search_id = self.current_search_id + 1
+            raw_text = self.output_df.loc[self.current_index, "english"]
+            query = split_english_text(raw_text)[0]
+        with telemetry.span("word change", search_id, query):
+            self.update_word_display()
+            if has_symbol:
+                self.show_existing_symbol()
+            else:
+                self.refresh_symbol_grid()
+            self.schedule_prefetch()
 
     def show_existing_symbol(self):
         self.scrollable_frame.grid_remove()
@@ -518,22 +3523,30 @@ class SymbolPickerPage:
             filename = self.output_df.loc[self.current_index, "symbol_filename"]
             symbol_name = self.output_df.loc[self.current_index, "symbol_name"]
             source = self.output_df.loc[self.current_index, "symbol_source"]
-            filepath = os.path.join(SELECTED_SYMBOLS_DIR, filename)
-            image_data = None
-            if filepath.endswith(".svg"):
-                image_data = cairosvg.svg2png(
-                    url=filepath, output_width=256, output_height=256
+            filepath = self.asset_store.resolve(
+                filename, self.output_df.loc[self.current_index, "symbol_asset"]
+            )
+            img_size = int(256 * UI_SCALE)
+            image = self.thumbnail_cache.get(filepath, img_size)
+            if self.existing_symbol_image is None:
+                self.existing_symbol_image = ctk.CTkImage(
+                    light_image=image, size=(img_size, img_size)
                 )
             else:
-                with open(filepath, "rb") as f:
-                    image_data = f.read()
-            image = Image.open(BytesIO(image_data))
-            img_size = int(256 * UI_SCALE)
-            ctk_image = ctk.CTkImage(light_image=image, size=(img_size, img_size))
-            self.existing_symbol_label.configure(image=ctk_image, text="")
+                self.existing_symbol_image.configure(light_image=image)
+            self.existing_symbol_label.configure(
+                image=self.existing_symbol_image, text=""
+            )
             self.existing_symbol_info.configure(
                 text=f"Symbol: {symbol_name}\nSource: {source}"
             )
+            if self.progress.low_confidence[self.current_index]:
+                self.keep_symbol_button.pack(
+                    pady=(0, int(PADDING_LARGE * UI_SCALE)),
+                    ipady=int(BUTTON_IPAD * UI_SCALE / 2),
+                )
+            else:
+                self.keep_symbol_button.pack_forget()
         except Exception as e:
             self.existing_symbol_label.configure(
                 image=None, text=f"Error loading symbol:\n{e}"
@@ -545,162 +3558,326 @@ class SymbolPickerPage:
         self.scrollable_frame.grid(row=2, column=0, sticky="nsew")
         self.current_search_id += 1
         self.cached_results = {}
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self.result_streams = {}
+        self.loading_sources = set()
+        self.cancel_pending_renders()
+        self.symbol_grid.clear()
+        self.update_more_button()
         custom_query = self.custom_search_entry.get().strip()
         query = custom_query if custom_query else self.current_word
         if query == "(No Word)":
             return
-        self.grid_row, self.grid_col = 0, 0
-        self.symbol_buttons = []
-        self.selected_index = -1
         self.flaticon_button.configure(state="normal")
-        self.process_local_search_batch(self.search_mulberry(query), "Mulberry")
-        self.process_local_search_batch(self.search_openmoji(query), "OpenMoji")
+        self.current_query = query
+        default_sources = ("Mulberry", "OpenMoji", "ARASAAC")
+        cached_search = self.search_result_cache.get(
+            (normalize_query(query), self.current_grammar)
+        )
+        if cached_search is not None:
+            self.rendered_icon_size, results = cached_search
+            self.cached_results = {
+                source: list(entries) for source, entries in results.items()
+            }
+            self.redraw_grid_from_cache()
+            for source in default_sources:
+                shown = len(self.cached_results.get(source, ()))
+                self.result_streams[source] = islice(
+                    self.open_result_stream(source, query), shown, None
+                )
+                # The prefetch may have hit a failed or offline search; retry it.
+                if shown < MAX_GRID_COLUMNS:
+                    self.start_result_batch(source, MAX_GRID_COLUMNS - shown)
+            self.update_more_button()
+            return
+        self.rendered_icon_size = self.get_current_icon_size()
         self.display_header("ARASAAC")
-        self.start_threaded_searches(query)
-        self.process_queue()
+        for source in default_sources:
+            self.result_streams[source] = self.open_result_stream(source, query)
+            self.start_result_batch(source, MAX_GRID_COLUMNS)
+        self.update_more_button()
+
+    def schedule_prefetch(self):
+        """Search the next PREFETCH_AHEAD entries in the background."""
+        upcoming = {}
+        size = self.get_current_icon_size()
+        end_index = min(self.current_index + 1 + PREFETCH_AHEAD, len(self.output_df))
+        for index in range(self.current_index + 1, end_index):
+            filename = (
+                self.output_df.loc[index, "symbol_filename"]
+                if "symbol_filename" in self.output_df.columns
+                else None
+            )
+            if pd.notna(filename):
+                filepath = self.asset_store.resolve(
+                    filename, self.output_df.loc[index, "symbol_asset"]
+                )
+                upcoming[filepath] = (self.prefetch_existing_symbol, filepath)
+                continue
+            query = split_english_text(self.output_df.loc[index, "english"])[0]
+            if query not in ("(No Word)", "(Empty)"):
+                grammar = self.row_grammar(index)
+                upcoming[(normalize_query(query), grammar)] = (
+                    self.prefetch_query,
+                    query,
+                    grammar,
+                    size,
+                )
+        for key, future in list(self.prefetch_futures.items()):
+            if future.done() or (key not in upcoming and future.cancel()):
+                del self.prefetch_futures[key]
+        for key, (prefetch_func, *args) in upcoming.items():
+            if key not in self.prefetch_futures and key not in self.search_result_cache:
+                self.prefetch_futures[key] = self.prefetch_pool.submit(
+                    prefetch_func, *args
+                )
+
+    def prefetch_existing_symbol(self, filepath):
+        try:
+            self.thumbnail_cache.get(filepath, int(256 * UI_SCALE))
+        except Exception as e:
+            print(f"Error prefetching existing symbol '{filepath}': {e}")
+
+    def prefetch_query(self, query, grammar, size):
+        """Run the default searches for query and keep the rendered results."""
+        key = (normalize_query(query), grammar)
+        if key in self.search_result_cache:
+            return
+        results = {}
+        for source, search_func in self.local_search_sources():
+            entries = []
+            for symbol in islice(search_func(query, grammar), MAX_GRID_COLUMNS):
+                try:
+                    image = self.thumbnail_cache.get(symbol["path"], size)
+                    entries.append((symbol, symbol["path"], "file_path", image))
+                except Exception as e:
+                    print(f"Error prefetching local symbol '{symbol.get('name')}': {e}")
+            if entries:
+                results[source] = entries
+        results["ARASAAC"] = []
+        for symbol, result, error in self.http_client.map_ordered(
+            lambda symbol: download_symbol_image(self.http_client, symbol["url"]),
+            list(islice(self.search_arasaac(query), MAX_GRID_COLUMNS)),
+        ):
+            if error is not None:
+                print(f"Error prefetching symbol '{symbol.get('name')}': {error}")
+                continue
+            image_data, image = result
+            results["ARASAAC"].append((symbol, image_data, "png_data", image))
+        self.search_result_cache.put(key, (size, results))
 
-    def start_threaded_searches(self, query, sources=["ARASAAC"]):
-        api_searches = []
-        if "ARASAAC" in sources:
-            api_searches.append((self.search_arasaac, query, "ARASAAC"))
-        if "Flaticon" in sources:
-            api_searches.append((self.search_flaticon, query, "Flaticon"))
-        for search_func, q, source_name in api_searches:
-            thread = threading.Thread(
-                target=self.run_search_in_thread,
-                args=(search_func, q, source_name, self.current_search_id),
+    def local_search_sources(self):
+        return (
+            ("Mulberry", self.search_mulberry),
+            ("OpenMoji", self.search_openmoji),
+        )
+
+    def result_search_funcs(self):
+        return {
+            **dict(self.local_search_sources()),
+            "ARASAAC": self.search_arasaac,
+            "Flaticon": self.search_flaticon,
+        }
+
+    def open_result_stream(self, source, query):
+        """Return an iterator over source's ranked results for query, capped in depth."""
+        local_search_funcs = dict(self.local_search_sources())
+        if source in local_search_funcs:
+            results = local_search_funcs[source](query, self.current_grammar)
+        else:
+            results = self.result_search_funcs()[source](query)
+        return islice(results, RESULTS_PER_SOURCE)
+
+    def cancel_pending_renders(self):
+        for future in self.render_futures:
+            future.cancel()
+        self.render_futures = []
+
+    def start_result_batch(self, source, count):
+        """Load the next count results of source's stream in the background."""
+        stream = self.result_streams.get(source)
+        if stream is None or source in self.loading_sources:
+            return
+        self.loading_sources.add(source)
+        args = (
+            source,
+            stream,
+            count,
+            self.rendered_icon_size,
+            self.current_search_id,
+            self.current_query,
+        )
+        if source in dict(self.local_search_sources()):
+            self.render_futures.append(
+                self.render_pool.submit(self.run_local_search, *args)
+            )
+        else:
+            self.remote_engine.cancel_before(self.current_search_id)
+            self.remote_engine.submit(
+                self.current_search_id, self.fetch_remote_batch, *args
             )
-            thread.daemon = True
-            thread.start()
+
+    def load_more_results(self):
+        for source in list(self.result_streams):
+            self.start_result_batch(source, RESULT_PAGE_SIZE)
+
+    def update_more_button(self):
+        self.more_button.configure(
+            state="normal" if self.result_streams else "disabled"
+        )
+
+    def check_scroll_for_more(self):
+        """Load the next batch once the user has scrolled to the bottom of the grid."""
+        if not self.result_streams or not self.scrollable_frame.winfo_ismapped():
+            return
+        top, bottom = self.scrollable_frame._parent_canvas.yview()
+        if top > 0 and bottom >= 1.0:
+            self.load_more_results()
 
     def fetch_flaticon_symbols(self):
         self.flaticon_button.configure(state="disabled")
         self.display_header("Flaticon")
         query = self.custom_search_entry.get().strip() or self.current_word
-        self.start_threaded_searches(query, sources=["Flaticon"])
+        self.current_query = query
+        self.result_streams["Flaticon"] = self.open_result_stream("Flaticon", query)
+        self.start_result_batch("Flaticon", MAX_GRID_COLUMNS)
+        self.update_more_button()
 
-    def run_search_in_thread(self, search_func, query, source, search_id):
-        symbol_metadata = search_func(query)
-        if not symbol_metadata:
-            return
-        for symbol in symbol_metadata:
+    async def fetch_remote_batch(self, source, stream, count, size, search_id, query):
+        """Fetch the next count results of a remote source and download their images.
+
+        Runs on the remote search engine's event loop; cancelling the task
+        cancels the downloads still queued or in flight.
+        """
+        with telemetry.span(f"search {source}", search_id, query):
+            batch = await self.remote_engine.run_blocking(
+                lambda: list(islice(stream, count))
+            )
+
+        async def download(symbol):
+            with telemetry.span(f"fetch {source}", search_id, query):
+                return await self.remote_engine.run_blocking(
+                    download_symbol_image, self.http_client, symbol["url"]
+                )
+
+        symbols = [symbol for symbol in batch if "url" in symbol]
+        downloads = [asyncio.ensure_future(download(symbol)) for symbol in symbols]
+        try:
+            for symbol, download_task in zip(symbols, downloads):
+                try:
+                    image_data, image = await download_task
+                except RequestCancelled:
+                    return
+                except Exception as e:
+                    print(f"Error processing symbol '{symbol.get('name')}': {e}")
+                    continue
+                self.results_queue.put(
+                    (
+                        "SYMBOL",
+                        source,
+                        symbol,
+                        (image_data, "png_data", image),
+                        search_id,
+                    )
+                )
+        finally:
+            for download_task in downloads:
+                download_task.cancel()
+        self.results_queue.put(
+            ("BATCH_DONE", source, None, len(batch) < count, search_id)
+        )
+
+    def run_local_search(self, source, stream, count, size, search_id, query):
+        """Take the next count ranked local results and render them off the Tk thread."""
+        with telemetry.span(f"search {source}", search_id, query):
+            batch = list(islice(stream, count))
+        for symbol in batch:
             if search_id != self.current_search_id:
                 return
             try:
-                if "url" in symbol:
-                    response = requests.get(symbol["url"], stream=True, timeout=10)
-                    response.raise_for_status()
-                    image_data = response.content
-                    self.results_queue.put(
-                        ("SYMBOL", source, symbol, image_data, search_id)
+                with telemetry.span("rasterize", search_id, query):
+                    image = self.thumbnail_cache.get(symbol["path"], size)
+                self.results_queue.put(
+                    (
+                        "SYMBOL",
+                        source,
+                        symbol,
+                        (symbol["path"], "file_path", image),
+                        search_id,
                     )
+                )
             except Exception as e:
-                print(f"Error processing symbol '{symbol.get('name')}' in thread: {e}")
+                print(f"Error processing local symbol '{symbol.get('name')}': {e}")
+        self.results_queue.put(
+            ("BATCH_DONE", source, None, len(batch) < count, search_id)
+        )
+
+    def rerender_cached_symbols(self, cached_results, size, search_id):
+        """Re-render cached local symbols at a new icon size off the Tk thread."""
+        images = {}
+        for source, entries in cached_results.items():
+            for position, (symbol, data, data_type, _) in enumerate(entries):
+                if search_id != self.current_search_id:
+                    return
+                if data_type == "file_path":
+                    try:
+                        images[(source, position)] = self.thumbnail_cache.get(
+                            data, size
+                        )
+                    except Exception as e:
+                        print(f"Error re-rendering '{symbol.get('name')}': {e}")
+        self.results_queue.put(("RESIZED", None, None, images, search_id))
 
     def process_queue(self):
-        try:
-            item_type, source, symbol_meta, image_data, search_id = (
-                self.results_queue.get_nowait()
-            )
+        while True:
+            try:
+                item_type, source, symbol_meta, payload, search_id = (
+                    self.results_queue.get_nowait()
+                )
+            except Empty:
+                break
             if search_id != self.current_search_id:
-                return
-            if source not in self.cached_results:
-                self.cached_results[source] = []
+                continue
             if item_type == "SYMBOL":
-                self.cached_results[source].append(
-                    (symbol_meta, image_data, "png_data")
+                data, data_type, image = payload
+                self.cached_results.setdefault(source, []).append(
+                    (symbol_meta, data, data_type, image)
                 )
-                self.display_symbol(source, symbol_meta, image_data, "png_data")
-        except Exception:
-            pass
-        finally:
-            self.root.after(50, self.process_queue)
+                with telemetry.span("widget build", search_id, self.current_query):
+                    self.display_symbol(source, symbol_meta, image)
+            elif item_type == "RESIZED":
+                size = self.get_current_icon_size()
+                for (cached_source, position), image in payload.items():
+                    symbol, data, data_type, _ = self.cached_results[cached_source][
+                        position
+                    ]
+                    self.cached_results[cached_source][position] = (
+                        symbol,
+                        data,
+                        data_type,
+                        image,
+                    )
+                    self.symbol_grid.set_image(cached_source, position, image, size)
+            elif item_type == "BATCH_DONE":
+                self.loading_sources.discard(source)
+                if payload:
+                    self.result_streams.pop(source, None)
+                    self.update_more_button()
+        self.check_scroll_for_more()
+        self.poll_integrity_queue()
+        self.root.after(50, self.process_queue)
 
     def display_header(self, source):
-        if self.grid_col != 0:
-            self.grid_row += 1
-        source_label = ctk.CTkLabel(
-            self.scrollable_frame, text=f"--- {source} ---", font=self.header_font
-        )
-        source_label.grid(
-            row=self.grid_row,
-            column=0,
-            columnspan=MAX_GRID_COLUMNS,
-            pady=int(PADDING_NORMAL * UI_SCALE),
-            sticky="w",
-        )
-        self.grid_row += 1
-        self.grid_col = 0
+        self.symbol_grid.add_section(source)
 
-    def display_symbol(self, source, symbol, data, data_type):
+    def display_symbol(self, source, symbol, image):
         try:
-            current_size = self.get_current_icon_size()
-            image_data = None
-            if data_type == "svg_path":
-                image_data = cairosvg.svg2png(
-                    url=data, output_width=current_size, output_height=current_size
-                )
-            elif data_type == "png_data":
-                image_data = data
-            image = Image.open(BytesIO(image_data))
-            ctk_image = ctk.CTkImage(
-                light_image=image, size=(current_size, current_size)
-            )
-            btn = ctk.CTkButton(
-                self.scrollable_frame,
-                image=ctk_image,
-                text=symbol["name"][:30],
-                compound="top",
-                command=lambda s=symbol, src=source: self.select_symbol(s, src),
-                fg_color="transparent",
-                border_width=0,
-                text_color=("black", "white"),
-                font=self.normal_font,
+            self.symbol_grid.add_symbol(
+                source, symbol, image, self.get_current_icon_size()
             )
-            btn.grid(
-                row=self.grid_row,
-                column=self.grid_col,
-                padx=self.get_current_padding(),
-                pady=self.get_current_padding(),
-            )
-            self.symbol_buttons.append(btn)
-            self.grid_col = (self.grid_col + 1) % MAX_GRID_COLUMNS
-            if self.grid_col == 0:
-                self.grid_row += 1
-            if self.selected_index == -1 and self.symbol_buttons:
-                self.selected_index = 0
-                self.update_selection_highlight()
         except Exception as e:
             print(f"Error displaying image for '{symbol.get('name', 'N/A')}': {e}")
 
-    def process_local_search_batch(self, symbols, source):
-        if not symbols:
-            return
-        self.display_header(source)
-        self.cached_results[source] = []
-        for symbol in symbols:
-            try:
-                if "path" in symbol:
-                    if symbol["path"].endswith(".svg"):
-                        self.cached_results[source].append(
-                            (symbol, symbol["path"], "svg_path")
-                        )
-                        self.display_symbol(source, symbol, symbol["path"], "svg_path")
-                    else:
-                        with open(symbol["path"], "rb") as f:
-                            image_data = f.read()
-                        self.cached_results[source].append(
-                            (symbol, image_data, "png_data")
-                        )
-                        self.display_symbol(source, symbol, image_data, "png_data")
-            except Exception as e:
-                print(f"Error processing local symbol '{symbol.get('name')}': {e}")
-
     def update_word_display(self):
-        for widget in self.word_buttons_frame.winfo_children():
-            widget.destroy()
         self.custom_search_entry.delete(0, "end")
         self.index_entry.delete(0, "end")
         self.index_entry.insert(0, str(self.current_index + 1))
@@ -708,43 +3885,39 @@ class SymbolPickerPage:
         raw_text = self.output_df.loc[self.current_index, "english"]
         if pd.isna(raw_text):
             self.original_string_label.configure(text="")
-            self.current_word_list = ["(No Word)"]
         else:
             self.original_string_label.configure(text=f'Original: "{str(raw_text)}"')
-            processed_text = (
-                str(raw_text)
-                .replace("(", ",")
-                .replace(")", "")
-                .replace(" or ", ",")
-                .replace(";", ",")
-            )
-            parts = processed_text.split(",")
-            self.current_word_list = [word.strip() for word in parts if word.strip()]
-            if not self.current_word_list:
-                self.current_word_list = ["(Empty)"]
+        self.current_grammar = self.row_grammar(self.current_index)
+        self.current_word_list = split_english_text(raw_text)
         self.current_word = self.current_word_list[0]
         self.base_word_for_filename = self.current_word_list[0]
         word_button_ipadding = int(BUTTON_IPAD * UI_SCALE / 4)
-        if len(self.current_word_list) > 1:
-            for i, word in enumerate(self.current_word_list):
-                btn = ctk.CTkButton(
-                    self.word_buttons_frame,
+        shown_words = self.current_word_list if len(self.current_word_list) > 1 else []
+        while len(self.word_buttons) < len(shown_words):
+            btn = ctk.CTkButton(self.word_buttons_frame, font=self.normal_font)
+            btn.grid(
+                row=0,
+                column=len(self.word_buttons),
+                padx=int(PADDING_SMALL * UI_SCALE),
+                ipady=word_button_ipadding,
+            )
+            self.word_buttons.append(btn)
+        accent_color = ctk.ThemeManager.theme["CTkButton"]["fg_color"]
+        for i, btn in enumerate(self.word_buttons):
+            if i < len(shown_words):
+                word = shown_words[i]
+                btn.configure(
                     text=word,
-                    font=self.normal_font,
                     command=lambda w=word: self.switch_search_term(w),
+                    fg_color=accent_color if i == 0 else "gray50",
                 )
-                btn.grid(
-                    row=0,
-                    column=i,
-                    padx=int(PADDING_SMALL * UI_SCALE),
-                    ipady=word_button_ipadding,
-                )
-                if i != 0:
-                    btn.configure(fg_color="gray50")
+                btn.grid()
+            else:
+                btn.grid_remove()
 
     def switch_search_term(self, new_word):
         self.current_word = new_word
-        for child in self.word_buttons_frame.winfo_children():
+        for child in self.word_buttons:
             if child.cget("text") == new_word:
                 child.configure(
                     fg_color=ctk.ThemeManager.theme["CTkButton"]["fg_color"]
@@ -753,6 +3926,41 @@ class SymbolPickerPage:
                 child.configure(fg_color="gray50")
         self.refresh_symbol_grid()
 
+    def jump_to(self, row_index):
+        if row_index is not None and row_index != self.current_index:
+            self.current_index = row_index
+            self.search_for_symbols()
+
+    def next_unfilled(self):
+        row_index = self.progress.next_unfilled(self.current_index)
+        if row_index is None:
+            messagebox.showinfo("Deck Complete", "Every entry has a symbol.")
+        self.jump_to(row_index)
+
+    def next_low_confidence(self):
+        row_index = self.progress.next_low_confidence(self.current_index)
+        if row_index is None:
+            messagebox.showinfo("Nothing to Review", "No picked symbol needs review.")
+        self.jump_to(row_index)
+
+    def keep_symbol(self):
+        """Accept the current row's automatic pick as reviewed and move on."""
+        self.output_df.loc[self.current_index, "symbol_reviewed"] = True
+        self.record_progress(self.current_index)
+        self.auto_save()
+        self.keep_symbol_button.pack_forget()
+        if self.progress.low_confidence.any():
+            self.next_low_confidence()
+
+    def record_progress(self, row_index):
+        self.progress.update(row_index, self.output_df)
+        self.update_progress_display()
+
+    def update_progress_display(self):
+        if len(self.progress):
+            self.progress_bar.set(self.progress.filled_count / len(self.progress))
+        self.progress_label.configure(text=self.progress.summary())
+
     def go_to_index(self, event=None):
         try:
             target_index = int(self.index_entry.get()) - 1
@@ -771,81 +3979,68 @@ class SymbolPickerPage:
             self.index_entry.insert(0, str(self.current_index + 1))
 
     def on_key_press(self, event):
-        if not self.symbol_buttons or self.selected_index == -1:
-            return
-        key, new_index = event.keysym, self.selected_index
+        key = event.keysym
         if key == "Right":
-            new_index += 1
+            self.symbol_grid.move_selection(1)
         elif key == "Left":
-            new_index -= 1
+            self.symbol_grid.move_selection(-1)
         elif key == "Down":
-            new_index += MAX_GRID_COLUMNS
+            self.symbol_grid.move_selection(MAX_GRID_COLUMNS)
         elif key == "Up":
-            new_index -= MAX_GRID_COLUMNS
+            self.symbol_grid.move_selection(-MAX_GRID_COLUMNS)
         elif key == "Return":
-            self.symbol_buttons[self.selected_index].invoke()
-            return
-        if 0 <= new_index < len(self.symbol_buttons):
-            self.selected_index = new_index
-            self.update_selection_highlight()
+            self.symbol_grid.invoke_selected()
+        elif key in ("n", "N"):
+            self.next_unfilled()
+        elif key in ("r", "R"):
+            self.next_low_confidence()
+        elif key == "F12" and telemetry.enabled:
+            self.toggle_telemetry_panel()
 
-    def update_selection_highlight(self):
-        accent_color = ctk.ThemeManager.theme["CTkButton"]["fg_color"]
-        for i, button in enumerate(self.symbol_buttons):
-            if i == self.selected_index:
-                button.configure(border_color=accent_color, border_width=2)
-                button.focus_set()
-                self.root.after(
-                    50,
-                    lambda b=button: self.scrollable_frame._parent_canvas.yview_moveto(
-                        b.winfo_y() / self.scrollable_frame.winfo_height()
-                    ),
-                )
-            else:
-                button.configure(border_width=0)
+    def toggle_telemetry_panel(self):
+        if self.telemetry_panel is not None and self.telemetry_panel.winfo_exists():
+            self.telemetry_panel.destroy()
+            self.telemetry_panel = None
+            return
+        self.telemetry_panel = TelemetryPanel(self.root, self.search_memo)
 
     def select_symbol(self, symbol, source):
-        sanitized_word = "".join(x for x in self.base_word_for_filename if x.isalnum())
-        if not sanitized_word:
-            sanitized_word = f"entry{self.current_index}"
         filename = ""
         try:
+            filename = symbol_filename(
+                self.base_word_for_filename, self.current_index, symbol, source
+            )
             if "path" in symbol:
-                original_filename = os.path.basename(symbol["path"])
-                filename = f"{sanitized_word}_{source}_{original_filename}"
-                shutil.copy(
-                    symbol["path"], os.path.join(SELECTED_SYMBOLS_DIR, filename)
-                )
+                asset = self.asset_store.put_file(symbol["path"])
             else:
-                response = requests.get(symbol["url"], stream=True, timeout=10)
-                response.raise_for_status()
-                if "ARASAAC" in source:
-                    pictogram_id = symbol["url"].split("/")[-1]
-                    symbol_name_cleaned = (
-                        "".join(
-                            c
-                            for c in symbol["name"]
-                            if c.isalnum() or c in (" ", "_", "-")
-                        )
-                        .strip()
-                        .replace(" ", "_")
-                    )
-                    filename = f"{sanitized_word}_{source}_{symbol_name_cleaned}_{pictogram_id}.png"
-                else:
-                    base_name = os.path.basename(symbol["url"].split("?")[0])
-                    if not os.path.splitext(base_name)[1]:
-                        base_name += ".png"
-                    filename = f"{sanitized_word}_{source}_{base_name}"
-                with open(os.path.join(SELECTED_SYMBOLS_DIR, filename), "wb") as f:
-                    shutil.copyfileobj(response.raw, f)
+                image_data = self.cached_symbol_data(source, symbol)
+                if image_data is None:
+                    image_data = self.http_client.fetch(symbol["url"])
+                asset = self.asset_store.put_bytes(
+                    image_data, os.path.splitext(filename)[1] or ".png"
+                )
+            self.asset_store.link(filename, asset)
             self.output_df.loc[self.current_index, "symbol_filename"] = filename
+            self.output_df.loc[self.current_index, "symbol_asset"] = asset
             self.output_df.loc[self.current_index, "symbol_name"] = symbol["name"]
             self.output_df.loc[self.current_index, "symbol_source"] = source
+            self.output_df.loc[self.current_index, "symbol_score"] = symbol.get(
+                "score", pd.NA
+            )
+            self.output_df.loc[self.current_index, "symbol_reviewed"] = True
+            self.record_progress(self.current_index)
             self.auto_save()
             self.next_word()
         except Exception as e:
             messagebox.showerror("Error", f"Could not save symbol: {e}")
 
+    def cached_symbol_data(self, source, symbol):
+        """Return the downloaded bytes of a displayed remote symbol, if held."""
+        for cached_symbol, data, data_type, _ in self.cached_results.get(source, []):
+            if cached_symbol is symbol and data_type == "png_data":
+                return data
+        return None
+
     def next_word(self):
         if self.current_index < len(self.output_df) - 1:
             self.current_index += 1
@@ -860,146 +4055,472 @@ class SymbolPickerPage:
             self.current_index -= 1
             self.search_for_symbols()
 
-    def auto_save(self):
+    def auto_save(self, row_index=None):
         if not self.autosave_var.get():
             return
-        self.save_to_current_file()
+        if not os.path.exists(self.output_filename):
+            self.save_to_current_file()
+            return
+        row_index = self.current_index if row_index is None else row_index
+        try:
+            with telemetry.span("save pick", self.current_search_id):
+                self.journal.append(row_index, self.output_df)
+        except Exception as e:
+            messagebox.showerror("Save Failed", f"Could not save file:\n{e}")
+            return
+        if self.journal.pending >= DECK_COMPACT_INTERVAL:
+            self.save_to_current_file()
 
     def save_to_current_file(self):
         """Saves the current DataFrame to its output_filename."""
         try:
-            self.output_df.to_csv(self.output_filename, index=False)
+            with telemetry.span("save deck", self.current_search_id):
+                self.journal.compact(self.output_df)
             print(f"Saved progress to {self.output_filename}")
             return True
         except Exception as e:
             messagebox.showerror("Save Failed", f"Could not save file:\n{e}")
             return False
 
+    def compact_journal(self):
+        """Fold any journaled picks into the deck CSV, e.g. before leaving the deck."""
+        if not self.journal.pending:
+            return True
+        return self.save_to_current_file()
+
     def save_as(self):
         new_filename = filedialog.asksaveasfilename(
             initialfile=os.path.basename(self.output_filename),
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv")],
+            filetypes=DECK_FILETYPES,
         )
         if new_filename:
             try:
-                self.output_df.to_csv(new_filename, index=False)
+                self.journal.compact(self.output_df)
+                new_journal = DeckJournal(new_filename)
+                write_deck(self.output_df, new_filename)
+                new_journal.discard()
                 messagebox.showinfo("Saved", f"Progress saved to {new_filename}")
                 self.output_filename = new_filename  # Update the current filename
+                self.journal = new_journal
             except Exception as e:
                 messagebox.showerror("Error", f"Could not save file: {e}")
 
     # --- Symbol Search Functions ---
-    def search_mulberry(self, query):
-        try:
-            df = self.mulberry_df.copy()
-            df["search_term"] = df["symbol-en"].str.replace("_", " ")
-            df["score"] = df["search_term"].apply(
-                lambda x: fuzz.token_sort_ratio(query, str(x))
-            )
-            return [
-                {
-                    "name": row["symbol-en"],
-                    "path": os.path.join(
-                        "mulberry-symbols", "EN-symbols", f"{row['symbol-en']}.svg"
-                    ),
-                }
-                for _, row in df.sort_values(by="score", ascending=False)
-                .head(4)
-                .iterrows()
-            ]
-        except Exception as e:
-            print(f"Error searching Mulberry: {e}")
-            return []
+    def search_mulberry(self, query, grammar=None):
+        return guarded_results(
+            "Mulberry",
+            self.search_memo.results(
+                "Mulberry",
+                query,
+                lambda q: self.mulberry_index.iter_ranked(q, grammar=grammar),
+                grammar,
+            ),
+        )
+
+    def search_openmoji(self, query, grammar=None):
+        return guarded_results(
+            "OpenMoji",
+            self.search_memo.results(
+                "OpenMoji",
+                query,
+                lambda q: self.openmoji_index.iter_ranked(q, grammar=grammar),
+                grammar,
+            ),
+        )
 
-    def search_openmoji(self, query):
+    def row_grammar(self, row_index):
+        """Return the Mulberry grammar filter for a deck row, from its tags column."""
         try:
-            df = self.openmoji_df.copy()
-            df["search_term"] = (
-                df["annotation"].fillna("") + " " + df["tags"].fillna("")
-            )
-            df["score"] = df["search_term"].apply(
-                lambda x: fuzz.token_sort_ratio(query, str(x))
-            )
-            return [
-                {
-                    "name": row["annotation"],
-                    "path": os.path.join(
-                        "openmoji-618x618-color", "emojis", f"{row['hexcode']}.png"
-                    ),
-                }
-                for _, row in df.sort_values(by="score", ascending=False)
-                .head(4)
-                .iterrows()
-            ]
-        except Exception as e:
-            print(f"Error searching OpenMoji: {e}")
-            return []
+            return vocab_grammar(deck_column(self.output_df, "tags").loc[row_index])
+        except KeyError:
+            return None
 
     def search_arasaac(self, query):
+        return guarded_results(
+            "ARASAAC", self.search_memo.results("ARASAAC", query, self.iter_arasaac)
+        )
+
+    def iter_arasaac(self, query):
+        # The search endpoint returns every match in one (cached) response, so
+        # paging only controls how many pictograms are downloaded at a time.
+        results = json.loads(self.http_client.fetch(f"{ARASAAC_API_URL}{query}"))
+        for item in results:
+            name = item.get("keywords", [{}])[0].get("keyword", "N/A")
+            yield {
+                "name": name,
+                "url": ARASAAC_PICTOGRAM_URL.format(id=item["_id"]),
+                "score": match_score(query, name),
+            }
+
+    def token_candidates(self, token):
+        """Return ranked (source, symbol) candidates for a sentence token.
+
+        Recent tokens are searched once; concurrent lookups of the same token
+        share one in-flight search. A search that failed or found nothing is
+        forgotten, so the next lookup tries again.
+        """
+        key = normalize_query(token)
+        with self.token_cache_lock:
+            future = self.token_cache.get(key)
+            submitted = future is None
+            if submitted:
+                future = self.token_search_pool.submit(self.search_token, key)
+                self.token_cache[key] = future
+                while len(self.token_cache) > SENTENCE_TOKEN_CACHE_ENTRIES:
+                    self.token_cache.popitem(last=False)
+            else:
+                self.token_cache.move_to_end(key)
+        if submitted:
+            future.add_done_callback(lambda done: self.forget_failed_token(key, done))
+        return future.result()
+
+    def forget_failed_token(self, key, future):
+        if not future.cancelled() and future.exception() is None and future.result():
+            return
+        with self.token_cache_lock:
+            if self.token_cache.get(key) is future:
+                del self.token_cache[key]
+
+    def search_token(self, token):
+        search_funcs = [*self.local_search_sources()]
+        if not OFFLINE_MODE:
+            search_funcs.append(("ARASAAC", self.search_arasaac))
+        candidates = []
+        for source, search_func in search_funcs:
+            with telemetry.span(f"token search {source}", query=token):
+                candidates.extend(
+                    (source, symbol)
+                    for symbol in islice(search_func(token), SENTENCE_CANDIDATES)
+                )
+        candidates.sort(key=lambda candidate: -candidate[1].get("score", 0))
+        return candidates
+
+    def candidate_image(self, source, symbol, size=SENTENCE_ICON_SIZE):
+        if "path" in symbol:
+            return self.thumbnail_cache.get(symbol["path"], size)
+        _, image = download_symbol_image(self.http_client, symbol["url"])
+        return image
+
+    def open_sentence_panel(self):
         try:
-            response = requests.get(f"{ARASAAC_API_URL}{query}", timeout=10)
-            response.raise_for_status()
-            return [
-                {
-                    "name": item.get("keywords", [{}])[0].get("keyword", "N/A"),
-                    "url": f"https://api.arasaac.org/api/pictograms/{item['_id']}",
-                }
-                for item in response.json()[:4]
-            ]
-        except Exception as e:
-            print(f"Error searching ARASAAC: {e}")
-            return []
+            sample_usage = deck_column(self.output_df, "sampleUsage")
+            pairs = sample_usage_pairs(sample_usage.loc[self.current_index])
+        except KeyError:
+            pairs = []
+        if not pairs:
+            messagebox.showinfo("Sentence Mode", "This entry has no sample sentences.")
+            return
+        if self.sentence_panel is not None and self.sentence_panel.winfo_exists():
+            self.sentence_panel.close()
+        self.sentence_panel = SentencePanel(self, self.current_index, pairs)
+
+    def save_sentence_strip(self, row_index, images):
+        """Save a composed strip for row_index and record it in the deck."""
+        word = split_english_text(self.output_df.loc[row_index, "english"])[0]
+        filename = sentence_strip_filename(word, row_index)
+        atomic_write_bytes(
+            os.path.join(SELECTED_SYMBOLS_DIR, filename),
+            compose_pictogram_strip(images),
+        )
+        self.output_df.loc[row_index, "sentence_symbol_filename"] = filename
+        self.auto_save(row_index)
+        return filename
 
     def search_flaticon(self, query):
         if FLATICON_API_KEY == "YOUR_FLATICON_API_KEY" or not FLATICON_API_KEY:
             print("Flaticon API key not set. Skipping search.")
-            return []
+            return iter(())
+        return guarded_results(
+            "Flaticon", self.search_memo.results("Flaticon", query, self.iter_flaticon)
+        )
+
+    def iter_flaticon(self, query):
+        """Yield Flaticon results a page of MAX_GRID_COLUMNS icons at a time."""
         headers = {"x-freepik-api-key": FLATICON_API_KEY, "Accept": "application/json"}
-        try:
-            search_params = {"term": query, "limit": 4, "order": "relevance"}
-            search_response = requests.get(
-                FLATICON_API_URLS["search"],
-                headers=headers,
-                params=search_params,
-                timeout=10,
-            )
-            search_response.raise_for_status()
-            search_data = search_response.json()
-        except Exception as e:
-            print(f"Error during Flaticon search step: {e}")
-            if "search_response" in locals():
-                print(f"Search Response Text: {search_response.text}")
-            return []
-        results = []
-        for item in search_data.get("data", []):
+
+        def resolve_download_url(item):
+            download_url_template = FLATICON_API_URLS["download"]
+            download_url = download_url_template.format(id=item["id"])
+            download_params = {"format": "png"}
+            download_response = self.http_client.get(
+                download_url, headers=headers, params=download_params
+            )
+            return download_response.json().get("data", {}).get("url")
+
+        page = 1
+        while True:
             try:
-                icon_id = item.get("id")
-                icon_name = item.get("name", "N/A")
-                if not icon_id:
-                    continue
-                download_url_template = FLATICON_API_URLS["download"]
-                download_url = download_url_template.format(id=icon_id)
-                download_params = {"format": "png"}
-                download_response = requests.get(
-                    download_url, headers=headers, params=download_params, timeout=10
+                search_params = {
+                    "term": query,
+                    "limit": MAX_GRID_COLUMNS,
+                    "page": page,
+                    "order": "relevance",
+                }
+                search_response = self.http_client.get(
+                    FLATICON_API_URLS["search"],
+                    headers=headers,
+                    params=search_params,
                 )
-                download_response.raise_for_status()
-                download_data = download_response.json()
-                final_url = download_data.get("data", {}).get("url")
-                if final_url:
-                    results.append({"name": icon_name, "url": final_url})
+                search_data = search_response.json()
             except Exception as e:
-                print(
-                    f"  -> ERROR getting download link for icon ID {item.get('id')}: {e}"
+                print(f"Error during Flaticon search step: {e}")
+                if "search_response" in locals():
+                    print(f"Search Response Text: {search_response.text}")
+                return
+
+            items = search_data.get("data", [])
+            for item, final_url, error in self.http_client.map_ordered(
+                resolve_download_url,
+                [item for item in items if item.get("id")],
+            ):
+                if error is not None:
+                    print(
+                        f"  -> ERROR getting download link for icon ID {item.get('id')}: {error}"
+                    )
+                elif final_url:
+                    yield {"name": item.get("name", "N/A"), "url": final_url}
+            if len(items) < MAX_GRID_COLUMNS:
+                return
+            page += 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Symbol Picker")
+    subparsers = parser.add_subparsers(dest="command")
+    prerender_parser = subparsers.add_parser(
+        "prerender",
+        help="Pre-render every bundled Mulberry and OpenMoji symbol into the thumbnail cache.",
+    )
+    prerender_parser.add_argument(
+        "--sizes",
+        nargs="+",
+        choices=list(ICON_SIZE_MAP),
+        help="Icon sizes to render (default: all).",
+    )
+    prerender_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: all cores).",
+    )
+    convert_parser = subparsers.add_parser(
+        "convert",
+        help="Convert a deck between the CSV, Parquet and Feather layouts.",
+    )
+    convert_parser.add_argument(
+        "source", help="Deck to read (.csv, .parquet, .feather)."
+    )
+    convert_parser.add_argument(
+        "destination", help="Deck to write; format from extension."
+    )
+    autopick_parser = subparsers.add_parser(
+        "autopick",
+        help="Pick the best symbol for every unfilled entry of a deck without the GUI.",
+    )
+    autopick_parser.add_argument(
+        "deck", help="Deck to fill (.csv, .parquet, .feather)."
+    )
+    autopick_parser.add_argument(
+        "--output",
+        help="Deck to write (default: update the input deck). Resumes if it exists.",
+    )
+    autopick_parser.add_argument(
+        "--threshold",
+        type=int,
+        default=AUTOPICK_THRESHOLD,
+        help=f"Minimum match score (0-100) to pick automatically (default: {AUTOPICK_THRESHOLD}).",
+    )
+    autopick_parser.add_argument(
+        "--workers",
+        type=int,
+        default=AUTOPICK_WORKERS,
+        help=f"Entries searched in parallel (default: {AUTOPICK_WORKERS}).",
+    )
+    autopick_parser.add_argument(
+        "--sources",
+        nargs="+",
+        choices=AUTOPICK_SOURCES,
+        default=AUTOPICK_SOURCES,
+        help="Sources to search (default: all).",
+    )
+    autopick_parser.add_argument(
+        "--rate-limit",
+        action="append",
+        default=[],
+        metavar="SOURCE=PER_SECOND",
+        help="Cap requests per second to a source, e.g. ARASAAC=2.",
+    )
+    autopick_parser.add_argument(
+        "--offline",
+        action="store_true",
+        default=OFFLINE_MODE,
+        help="Search only the local Mulberry and OpenMoji catalogs.",
+    )
+    benchmark_parser = subparsers.add_parser(
+        "benchmark",
+        help="Time search, thumbnail rendering and saving on the bundled data.",
+    )
+    benchmark_parser.add_argument(
+        "--samples",
+        type=int,
+        default=200,
+        help="Words, symbols and deck rows sampled per benchmark (default: 200).",
+    )
+    benchmark_parser.add_argument(
+        "--baseline",
+        default=BENCHMARK_BASELINE,
+        help=f"Baseline results file to compare against (default: {BENCHMARK_BASELINE}).",
+    )
+    benchmark_parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store these results as the new baseline.",
+    )
+    export_parser = subparsers.add_parser(
+        "export-symbols",
+        help="Copy a deck's picked symbols into a flat folder of per-word files.",
+    )
+    export_parser.add_argument("deck", help="Deck whose symbols to export.")
+    export_parser.add_argument("destination", help="Folder to write the files to.")
+    store_parser = subparsers.add_parser(
+        "store-assets",
+        help="Move a deck's existing per-word symbol files into the asset store.",
+    )
+    store_parser.add_argument("deck", help="Deck whose symbols to deduplicate.")
+    verify_parser = subparsers.add_parser(
+        "verify",
+        help="Check that every symbol file a deck references exists and decodes.",
+    )
+    verify_parser.add_argument("deck", help="Deck whose symbols to check.")
+    verify_parser.add_argument(
+        "--repair",
+        action="store_true",
+        help="Restore missing or corrupt symbols from their library or download.",
+    )
+    verify_parser.add_argument(
+        "--orphans",
+        action="store_true",
+        help="Also list symbol files this deck does not use; other decks may.",
+    )
+    verify_parser.add_argument(
+        "--workers",
+        type=int,
+        default=INTEGRITY_WORKERS,
+        help=f"Files checked in parallel (default: {INTEGRITY_WORKERS}).",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command is not None:
+        import_heavy_modules()
+    if args.command == "convert":
+        source_df = read_deck(args.source)
+        DeckJournal(args.source).replay(source_df)
+        write_deck(source_df, args.destination)
+        print(f"Wrote {len(source_df)} entries to {args.destination}")
+        return
+    if args.command == "autopick":
+        rate_limits = dict(AUTOPICK_RATE_LIMITS)
+        for limit in args.rate_limit:
+            source, _, rate = limit.partition("=")
+            try:
+                rate_limits[source] = float(rate)
+            except ValueError:
+                parser.error(f"invalid --rate-limit {limit!r}")
+        output = args.output or args.deck
+        source = output if os.path.exists(output) else args.deck
+        deck_df = read_deck(source)
+        DeckJournal(source).replay(deck_df)
+        journal = DeckJournal(output)
+        if source != output:
+            journal.replay(deck_df)
+        picker = AutoPicker(args.sources, args.threshold, rate_limits, args.offline)
+        try:
+            picker.run(deck_df, journal, args.workers)
+        finally:
+            journal.compact(deck_df)
+        print(f"Wrote {len(deck_df)} entries to {output}")
+        return
+    if args.command in ("export-symbols", "store-assets"):
+        deck_df = read_deck(args.deck)
+        journal = DeckJournal(args.deck)
+        journal.replay(deck_df)
+        ensure_symbol_columns(deck_df)
+        asset_store = AssetStore()
+        if args.command == "export-symbols":
+            copied = asset_store.export_flat(deck_df, args.destination)
+            print(f"Exported {copied} symbols to {args.destination}")
+            return
+        stored = 0
+        for row in deck_df.index[
+            deck_df["symbol_filename"].notna() & deck_df["symbol_asset"].isna()
+        ]:
+            try:
+                deck_df.loc[row, "symbol_asset"] = asset_store.adopt(
+                    deck_df.loc[row, "symbol_filename"]
                 )
+            except OSError as e:
+                print(f"Could not store entry {row + 1}: {e}")
                 continue
-        return results
-
+            stored += 1
+        journal.compact(deck_df)
+        print(f"Stored {stored} symbols; {args.deck} now records their asset hashes")
+        return
+    if args.command == "verify":
+        deck_df = read_deck(args.deck)
+        journal = DeckJournal(args.deck)
+        journal.replay(deck_df)
+        ensure_symbol_columns(deck_df)
+        scan = DeckIntegrityScan(
+            AssetStore(), HttpClient(cache=HttpCache()), args.workers
+        )
+        started = time.perf_counter()
+        report = scan.run(deck_df, orphans=args.orphans)
+        print(f"{integrity_summary(report)} in {time.perf_counter() - started:.2f}s")
+        for status in ("missing", "corrupt"):
+            for row, column, filename in report[status]:
+                print(f"  {status}: entry {row + 1} {column} {filename}")
+        for path in report.get("orphaned", ()):
+            print(f"  not used by this deck: {path}")
+        if not args.repair:
+            return
+        repaired, failures = scan.repair_all(deck_df, report)
+        for row, error in failures:
+            print(f"  could not repair entry {row + 1}: {error}")
+        if repaired:
+            for row, asset in repaired.items():
+                deck_df.loc[row, "symbol_asset"] = asset
+            journal.compact(deck_df)
+        print(f"Repaired {len(repaired)} entries")
+        return
+    if args.command == "benchmark":
+        results = benchmark_hot_paths(args.samples)
+        baseline = None
+        if os.path.exists(args.baseline) and not args.save_baseline:
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)["results"]
+        regressions = print_benchmarks(results, baseline)
+        if args.save_baseline:
+            record = {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "results": results,
+            }
+            atomic_write_bytes(args.baseline, json.dumps(record, indent=2).encode())
+            print(f"Saved baseline to {args.baseline}")
+        if regressions:
+            raise SystemExit(f"Slower than baseline: {', '.join(regressions)}")
+        return
+    if args.command == "prerender":
+        sizes = [ICON_SIZE_MAP[name] for name in args.sizes] if args.sizes else None
+        prerender_library(sizes, args.workers)
+        return
 
-if __name__ == "__main__":
     ctk.set_appearance_mode("Dark")
     ctk.set_default_color_theme("blue")
     root = ctk.CTk()
-    app = SymbolPickerApp(root)
+    SymbolPickerApp(root)
     root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
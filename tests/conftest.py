@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import pictogram_picker  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def heavy_modules():
+    try:
+        pictogram_picker.import_heavy_modules()
+    except OSError as e:  # e.g. cairosvg installed without the cairo library
+        pytest.skip(f"pictogram_picker dependencies unavailable: {e}")
+
+
+@pytest.fixture
+def repo_root(monkeypatch):
+    """Run the test from the repository root, where the bundled catalogs live."""
+    monkeypatch.chdir(REPO_ROOT)
+    return REPO_ROOT
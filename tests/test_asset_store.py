@@ -0,0 +1,25 @@
+import os
+
+import pictogram_picker as pp
+
+
+def test_relinking_same_blob_leaves_no_temp_files(tmp_path):
+    store = pp.AssetStore(str(tmp_path), str(tmp_path / ".assets"))
+    ref = store.put_bytes(b"image", ".png")
+    store.link("cat_0.png", ref)
+    store.link("cat_0.png", ref)
+    assert sorted(os.listdir(tmp_path)) == [".assets", "cat_0.png"]
+    assert os.path.samefile(tmp_path / "cat_0.png", store.blob_path(ref))
+
+
+def test_link_copies_the_blob_without_hardlink_support(tmp_path, monkeypatch):
+    store = pp.AssetStore(str(tmp_path), str(tmp_path / ".assets"))
+    ref = store.put_bytes(b"image", ".png")
+
+    def no_hardlinks(source, destination):
+        raise PermissionError("hardlinks not supported")
+
+    monkeypatch.setattr(pp.os, "link", no_hardlinks)
+    store.link("cat_0.png", ref)
+    assert (tmp_path / "cat_0.png").read_bytes() == b"image"
+    assert sorted(os.listdir(tmp_path)) == [".assets", "cat_0.png"]
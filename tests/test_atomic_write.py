@@ -0,0 +1,18 @@
+import os
+
+import pictogram_picker as pp
+
+
+def test_atomic_write_uses_default_file_mode(tmp_path):
+    path = tmp_path / "new.bin"
+    pp.atomic_write_bytes(str(path), b"data")
+    assert os.stat(path).st_mode & 0o777 == 0o666 & ~pp.UMASK
+
+
+def test_atomic_write_keeps_existing_file_mode(tmp_path):
+    path = tmp_path / "existing.bin"
+    path.write_bytes(b"old")
+    os.chmod(path, 0o640)
+    pp.atomic_write_bytes(str(path), b"new")
+    assert path.read_bytes() == b"new"
+    assert os.stat(path).st_mode & 0o777 == 0o640
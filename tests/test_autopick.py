@@ -0,0 +1,84 @@
+import json
+
+import pandas as pd
+
+import pictogram_picker as pp
+
+
+class StubArasaac:
+    """Answers every ARASAAC search with the given status and body."""
+
+    def __init__(self, status=200, results=()):
+        self.status = status
+        self.results = list(results)
+
+    def fetch(self, url, params=None, headers=None):
+        if self.status != 200:
+            response = pp.requests.Response()
+            response.status_code = self.status
+            raise pp.requests.HTTPError(f"{self.status} for {url}", response=response)
+        return json.dumps(self.results).encode()
+
+
+def arasaac_picker(http_client):
+    picker = pp.AutoPicker(["Mulberry", "ARASAAC"], rate_limits={}, offline=True)
+    picker.sources = ["Mulberry", "ARASAAC"]
+    picker.limiters["ARASAAC"] = pp.RateLimiter(None)
+    picker.http_client = http_client
+    return picker
+
+
+def test_arasaac_errors_keep_local_candidates(repo_root):
+    for status in (404, 500):
+        best = arasaac_picker(StubArasaac(status)).best_candidate("cat")
+        assert best is not None
+        score, source, symbol = best
+        assert (score, source) == (100, "Mulberry")
+
+
+def test_autopick_keeps_existing_sentence_strip(repo_root, tmp_path, monkeypatch):
+    monkeypatch.setattr(pp, "SELECTED_SYMBOLS_DIR", str(tmp_path))
+    df = pp.ensure_symbol_columns(pd.DataFrame({"english": ["zzzqqq"]}))
+    df.loc[0, "sentence_symbol_filename"] = "zzzqqq_sentence_0.png"
+    picker = pp.AutoPicker(["Mulberry"], offline=True)
+    picker.run(df, pp.DeckJournal(str(tmp_path / "deck.csv")), workers=1)
+    assert df.loc[0, "sentence_symbol_filename"] == "zzzqqq_sentence_0.png"
+    assert pd.notna(df.loc[0, "symbol_score"])
+
+
+def offline_picker():
+    return pp.AutoPicker(["Mulberry", "OpenMoji"], offline=True)
+
+
+def test_tag_only_matches_are_not_autopicked(repo_root):
+    picker = offline_picker()
+    for word in ("is", "to", "it", "my", "you"):
+        score, source, symbol = picker.best_candidate(pp.normalize_query(word))
+        assert score < picker.threshold, (word, symbol["name"])
+
+
+def test_autopick_picks_infinitive_verbs(repo_root, tmp_path, monkeypatch):
+    monkeypatch.setattr(pp, "SELECTED_SYMBOLS_DIR", str(tmp_path))
+    picker = offline_picker()
+    picker.asset_store = pp.AssetStore(str(tmp_path), str(tmp_path / ".assets"))
+    for row_index, (text, name) in enumerate(
+        [("to sit", "sit_,_to"), ("to come", "come_,_to"), ("to eat", "eat_,_to")]
+    ):
+        values = picker.pick_row(row_index, text)
+        assert values["symbol_score"] == 100
+        assert (values["symbol_source"], values["symbol_name"]) == ("Mulberry", name)
+
+
+def test_rerun_with_lower_threshold_picks_rows_scored_before(
+    repo_root, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(pp, "SELECTED_SYMBOLS_DIR", str(tmp_path))
+    df = pp.ensure_symbol_columns(pd.DataFrame({"english": ["cat", "zzzqqq"]}))
+    journal = pp.DeckJournal(str(tmp_path / "deck.csv"))
+    picker = pp.AutoPicker(["Mulberry"], threshold=101, offline=True)
+    picker.asset_store = pp.AssetStore(str(tmp_path), str(tmp_path / ".assets"))
+    assert picker.run(df, journal, workers=1) == 0
+    assert df.loc[0, "symbol_score"] == 100
+    picker.threshold = 96
+    assert picker.run(df, journal, workers=1) == 1
+    assert df.loc[0, "symbol_name"] == "cat"
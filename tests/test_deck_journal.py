@@ -0,0 +1,47 @@
+import os
+
+import pandas as pd
+
+import pictogram_picker as pp
+
+
+def make_deck(words):
+    return pp.ensure_symbol_columns(pd.DataFrame({"english": words}))
+
+
+def test_start_new_over_existing_deck_replays_onto_new_deck(tmp_path):
+    path = str(tmp_path / "deck.csv")
+    old_df = make_deck([f"old{i}" for i in range(4)])
+    old_df.loc[0, "symbol_filename"] = "old0.png"
+    pp.write_deck(old_df, path)
+    stale_journal = pp.DeckJournal(path)
+    old_df.loc[1, "symbol_filename"] = "old1.png"
+    stale_journal.append(1, old_df)
+
+    new_df = make_deck([f"new{i}" for i in range(10)])
+    pp.create_deck(new_df, path)
+    journal = pp.DeckJournal(path)
+    assert journal.pending == 0
+    new_df.loc[7, "symbol_filename"] = "new7.png"
+    journal.append(7, new_df)
+
+    # A crash before compaction: reload the deck from disk and replay the log.
+    reloaded = pp.read_deck(path)
+    assert pp.DeckJournal(path).replay(reloaded) == 1
+    assert reloaded["english"].tolist() == new_df["english"].tolist()
+    assert reloaded["symbol_filename"].notna().tolist() == [i == 7 for i in range(10)]
+
+    journal.compact(new_df)
+    written = pp.read_deck(path)
+    assert len(written) == 10
+    assert written.loc[7, "symbol_filename"] == "new7.png"
+    assert pp.DeckJournal(path).pending == 0
+
+
+def test_write_deck_keeps_existing_file_mode(tmp_path):
+    path = str(tmp_path / "deck.csv")
+    pp.write_deck(make_deck(["cat"]), path)
+    assert os.stat(path).st_mode & 0o777 == 0o666 & ~pp.UMASK
+    os.chmod(path, 0o644)
+    pp.write_deck(make_deck(["dog"]), path)
+    assert os.stat(path).st_mode & 0o777 == 0o644
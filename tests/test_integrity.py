@@ -0,0 +1,19 @@
+import pandas as pd
+
+import pictogram_picker as pp
+
+
+def make_store(tmp_path):
+    store = pp.AssetStore(str(tmp_path), str(tmp_path / ".assets"))
+    (tmp_path / "other_deck_cat.png").write_bytes(b"x")
+    return store
+
+
+def test_orphans_are_only_reported_on_request(tmp_path):
+    scan = pp.DeckIntegrityScan(make_store(tmp_path))
+    df = pp.ensure_symbol_columns(pd.DataFrame({"english": ["cat"]}))
+    report = scan.run(df)
+    assert "orphaned" not in report
+    assert "not used" not in pp.integrity_summary(report)
+    report = scan.run(df, orphans=True)
+    assert report["orphaned"] == [str(tmp_path / "other_deck_cat.png")]
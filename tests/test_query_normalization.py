@@ -0,0 +1,121 @@
+from itertools import islice
+from types import SimpleNamespace
+
+import pytest
+
+import pictogram_picker as pp
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("To Run", "run"),
+        ("run (v.)", "run"),
+        ("  the   Cat ", "cat"),
+        ("an apple", "apple"),
+        ("to be", "be"),
+        ("is", "be"),
+        ("children's", "child"),
+        ("(foo)", "foo"),
+        ("to", "to"),
+        ("the", "the"),
+        ("don't", "don't"),
+        ("Christmas", "christmas"),
+        ("glasses", "glasses"),
+        ("pants", "pants"),
+        ("cookies", "cookies"),
+        ("goes out", "goes out"),
+        ("clothes", "clothes"),
+        ("potatoes", "potatoes"),
+    ],
+)
+def test_normalize_query(text, expected):
+    assert pp.normalize_query(text) == expected
+
+
+def test_memo_searches_with_its_normalized_key():
+    memo = pp.SearchMemo()
+    searched = []
+
+    def search(query):
+        searched.append(query)
+        return iter([query])
+
+    assert list(memo.results("Mulberry", " Christmas ", search)) == ["christmas"]
+    assert list(memo.results("Mulberry", "the christmas", search)) == ["christmas"]
+    assert searched == ["christmas"]
+    assert memo.stats() == {"Mulberry": (1, 1)}
+
+
+def test_memo_retries_failed_searches():
+    memo = pp.SearchMemo()
+
+    def failing(query):
+        yield "partial"
+        raise RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError):
+        list(memo.results("ARASAAC", "cat", failing))
+    assert list(memo.results("ARASAAC", "cat", lambda query: iter(["ok"]))) == ["ok"]
+
+
+def test_christmas_keeps_its_exact_mulberry_match(repo_root):
+    index = pp.SymbolIndex.load(
+        "mulberry", pp.MULBERRY_INFO_CSV, pp.mulberry_catalog_entries
+    )
+    memo = pp.SearchMemo()
+    results = memo.results(
+        "Mulberry", "Christmas", lambda query: index.iter_ranked(query)
+    )
+    top = next(islice(results, 1))
+    assert top["score"] == 100
+
+
+@pytest.mark.parametrize(
+    "gloss, name", [("to eat", "eat_,_to"), ("to sit", "sit_,_to")]
+)
+def test_infinitive_glosses_find_their_mulberry_verb(repo_root, gloss, name):
+    page = SimpleNamespace(
+        search_memo=pp.SearchMemo(),
+        mulberry_index=pp.SymbolIndex.load(
+            "mulberry", pp.MULBERRY_INFO_CSV, pp.mulberry_catalog_entries
+        ),
+    )
+    top = next(pp.SymbolPickerPage.search_mulberry(page, gloss))
+    assert (top["name"], top["score"]) == (name, 100)
+
+
+def test_memo_keeps_at_most_limit_results_and_releases_the_stream():
+    def endless(query):
+        count = 0
+        while True:
+            yield count
+            count += 1
+
+    stream = endless("cat")
+    memoized = pp.MemoizedResults(stream, limit=5)
+    assert list(islice(memoized, 10)) == [0, 1, 2, 3, 4]
+    assert memoized.results is None
+    assert stream.gi_frame is None
+    assert list(memoized) == [0, 1, 2, 3, 4]
+
+
+def test_memo_results_do_not_depend_on_lookup_order(repo_root):
+    index = pp.SymbolIndex.load(
+        "mulberry", pp.MULBERRY_INFO_CSV, pp.mulberry_catalog_entries
+    )
+
+    def lookups(queries):
+        page = SimpleNamespace(search_memo=pp.SearchMemo(), mulberry_index=index)
+        return {
+            query: [
+                symbol["name"]
+                for symbol in pp.SymbolPickerPage.search_mulberry(page, query)
+            ]
+            for query in queries
+        }
+
+    queries = ["is", "be", "to be"]
+    forward = lookups(queries)
+    assert forward == lookups(reversed(queries))
+    assert forward["is"] == forward["to be"]
@@ -0,0 +1,75 @@
+import pytest
+
+import pictogram_picker as pp
+
+QUERIES = ["cat", "friend", "please", "thank you", "run", "mother"]
+
+
+def load_index(name):
+    if name == "mulberry":
+        return pp.SymbolIndex.load(
+            name, pp.MULBERRY_INFO_CSV, pp.mulberry_catalog_entries
+        )
+    return pp.SymbolIndex.load(
+        name, pp.OPENMOJI_METADATA_CSV, pp.openmoji_catalog_entries
+    )
+
+
+def exhaustive_top(index, query, k):
+    """Rank the catalog with fuzzywuzzy's own token_sort_ratio, term by term."""
+    best = {}
+    for position, term, weight in zip(
+        index.term_entries.tolist(), index.search_terms, index.term_weights.tolist()
+    ):
+        score = pp.fuzz.token_sort_ratio(query, term) * weight
+        best[position] = max(best.get(position, 0), score)
+    ranked = sorted(best.items(), key=lambda item: (-round(item[1]), item[0]))
+    return [
+        (index.entries[position]["name"], round(score))
+        for position, score in ranked[:k]
+    ]
+
+
+@pytest.mark.parametrize("name", ["mulberry", "openmoji"])
+@pytest.mark.parametrize("rapidfuzz", [True, False])
+def test_ranking_matches_exhaustive_scan(repo_root, monkeypatch, name, rapidfuzz):
+    if not rapidfuzz:
+        monkeypatch.setattr(pp, "rapid_process", None)
+    elif pp.rapid_process is None:
+        pytest.skip("rapidfuzz is not installed")
+    index = load_index(name)
+    for query in QUERIES:
+        ranked = [
+            (symbol["name"], symbol["score"]) for symbol in index.iter_ranked(query, 4)
+        ]
+        assert ranked == exhaustive_top(index, query, 4), query
+
+
+@pytest.mark.parametrize(
+    "name, gloss, expected",
+    [
+        ("mulberry", "to sit", ("sit_,_to", 100)),
+        ("mulberry", "friend", ("find_,_to", 80)),
+        ("mulberry", "please", ("peas", 80)),
+        ("openmoji", "friend", ("busts in silhouette", 90)),
+        ("openmoji", "please", ("face holding back tears", 90)),
+    ],
+)
+def test_known_glosses_top_result(repo_root, name, gloss, expected):
+    top = next(load_index(name).iter_ranked(pp.normalize_query(gloss), 1))
+    assert (top["name"], top["score"]) == expected
+
+
+def test_word_vectors_work_without_a_writable_cache(tmp_path, monkeypatch):
+    blocker = tmp_path / "cache"
+    blocker.write_text("not a directory")
+    monkeypatch.setattr(pp, "CACHE_DIR", str(blocker / "index"))
+    vectors_path = tmp_path / "vectors.txt"
+    vectors_path.write_text("car 1 0 0\nautomobile 0.9 0.1 0\nbird 0 0 1\n")
+    word_vectors = pp.WordVectors.load(str(vectors_path))
+    index = pp.SymbolIndex(
+        [{"name": "car"}, {"name": "bird"}],
+        [(0, "automobile", 1.0), (1, "bird", 1.0)],
+    )
+    index.attach_vectors("test", ("stamp",), word_vectors)
+    assert next(index.iter_ranked("car", 1))["name"] == "car"